@@ -173,11 +173,12 @@ class Assistant:
             if self.decision_engine.should_clarify(intent):
                 return await self._generate_clarification_response(intent)
             
-            # Step 4: Retrieve Context
-            context_docs = await self.retrieval_system.retrieve(
+            # Step 4: Retrieve Context (frozen so the planner, generator and
+            # Response all share one read-only sequence)
+            context_docs = tuple(await self.retrieval_system.retrieve(
                 query=text,
                 top_k=self.config.retrieval.top_k_dense
-            )
+            ))
             
             # Step 5: Fetch real-time data if needed
             realtime_context = await self._fetch_realtime_data(text, intent)
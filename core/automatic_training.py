@@ -4,12 +4,18 @@ Learns from positive user feedback and continuously improves responses.
 """
 
 import asyncio
+import copy
 import json
+import mmap
+import re
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
-import pickle
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
+import random
 
 from core.logger import get_logger
 from core.intent_classifier_enhanced import EnhancedIntentClassifier
@@ -19,30 +25,174 @@ from monitoring.metrics import get_metrics_collector
 
 logger = get_logger(__name__)
 
+# Optional imports
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not available, feedback scoring will use substring scans")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available, training data will be serialized with json")
+
+# Positive indicators
+POSITIVE_FEEDBACK_WORDS = (
+    'good', 'great', 'excellent', 'perfect', 'amazing', 'awesome',
+    'helpful', 'useful', 'correct', 'right', 'yes', 'exactly',
+    'thank you', 'thanks', 'appreciate', 'love it', 'brilliant',
+    'fantastic', 'wonderful', 'outstanding', 'superb', 'nice',
+    'cool', 'sweet', 'nice job', 'well done', 'spot on'
+)
+
+# Negative indicators (to avoid false positives)
+NEGATIVE_FEEDBACK_WORDS = (
+    'no', 'not', 'wrong', 'bad', 'terrible', 'awful', 'horrible',
+    'useless', 'unhelpful', 'incorrect', 'false', 'stupid'
+)
+
+# Common words ignored when grouping queries
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'what', 'how', 'when', 'where', 'why'
+})
+
+# Pattern categories, in priority order
+_CAT_KEYWORDS = (
+    ('time_date', ('time', 'date', 'when')),
+    ('search', ('search', 'find', 'look')),
+    ('greeting', ('hello', 'hi', 'hey')),
+    ('financial', ('bitcoin', 'currency', 'financial')),
+    ('railway', ('train', 'railway')),
+    ('entertainment', ('joke', 'quote', 'entertainment')),
+)
+_CAT_RANK = {name: rank for rank, (name, _) in enumerate(_CAT_KEYWORDS)}
+
+# One alternation; the named group that matched is the category.
+# Keywords must start a word but may carry a suffix ("looking", "trains")
+_CAT_RE = re.compile(
+    '|'.join(
+        rf"(?P<{name}>\b(?:{'|'.join(keywords)})\w*)" for name, keywords in _CAT_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+
+def _dump_json_bytes(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json_bytes(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _public_fields(interaction: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an interaction without its cached (underscore-prefixed) fields"""
+    return {k: v for k, v in interaction.items() if not k.startswith('_')}
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream records from a JSONL file via mmap, without decoding it whole"""
+    if path.stat().st_size == 0:
+        return
+    
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                if end > start:
+                    yield _load_json_bytes(view[start:end])
+                start = end + 1
+
+
+def _build_feedback_automaton():
+    """Build one Aho-Corasick automaton over both feedback vocabularies"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word in POSITIVE_FEEDBACK_WORDS:
+        automaton.add_word(word, ('pos', word))
+    for word in NEGATIVE_FEEDBACK_WORDS:
+        automaton.add_word(word, ('neg', word))
+    automaton.make_automaton()
+    return automaton
+
 
 class AutomaticTrainingSystem:
     """
     Automatic training system that learns from positive user interactions
     """
     
-    def __init__(self, training_threshold: int = 5, auto_save_interval: int = 3600):
+    # Shared across instances; built once at import
+    _feedback_automaton = _build_feedback_automaton()
+    
+    def __init__(self, training_threshold: int = 5, auto_save_interval: int = 3600,
+                 flush_delay: float = 0.1, max_pending: int = 32,
+                 max_interactions: int = 10_000,
+                 segment_max_bytes: int = 50 * 1024 * 1024, segments_to_load: int = 4):
         """
         Initialize automatic training system
         
         Args:
             training_threshold: Number of positive feedbacks before training
             auto_save_interval: Auto-save interval in seconds
+            flush_delay: Seconds to wait for more feedback before flushing a batch
+            max_pending: Pending interactions that force an immediate flush
+            max_interactions: Raw interactions kept in memory; older ones are
+                folded into aggregate counts
+            segment_max_bytes: Size at which the interaction log rolls to a new segment
+            segments_to_load: Most recent log segments loaded at startup; older
+                segments are compacted into aggregate counts and deleted
         """
         self.training_threshold = training_threshold
         self.auto_save_interval = auto_save_interval
+        self.flush_delay = flush_delay
+        self.max_pending = max_pending
+        self.segment_max_bytes = segment_max_bytes
+        self.segments_to_load = max(1, segments_to_load)
         
         # Training data storage
-        self.positive_interactions = []
+        self.positive_interactions = deque(maxlen=max_interactions)
         self.training_patterns = {}
         self.learned_responses = {}
+        self._response_counts = {}
+        self._response_rotations = {}
+        self._rotate_idx = {}
+        
+        # Incremental indexes over positive_interactions
+        self._query_groups = defaultdict(deque)
+        self._keyword_index = defaultdict(deque)
+        
+        # Aggregate counts from interactions evicted out of the window
+        self._tenured_count = 0
+        self._tenured_kw_counter = Counter()
+        self._tenured_group_counter = Counter()
+        
+        # Aggregate counts from compacted log segments (persisted in meta)
+        self._compacted_count = 0
+        self._compacted_kw_counter = Counter()
+        self._compacted_group_counter = Counter()
         
         # Components
         self.intent_classifier = EnhancedIntentClassifier()
+        self._base_training_data = self.intent_classifier._default_training_data()
         self.knowledge_integrator = get_knowledge_integrator()
         self.metrics = get_metrics_collector()
         
@@ -50,13 +200,23 @@ class AutomaticTrainingSystem:
         self.last_training_time = time.time()
         self.training_count = 0
         self.positive_feedback_count = 0
+        self._save_lock = asyncio.Lock()
+        
+        # Interactions waiting for the next batched knowledge update + log write
+        self._pending_interactions = []
+        self._flush_task = None
         
-        # File paths
-        self.training_data_file = Path("data/training_data.json")
-        self.learned_patterns_file = Path("data/learned_patterns.pkl")
+        # File paths; the interaction log is split into
+        # training_data.NNNN.jsonl segments
+        self.training_data_dir = Path("data")
+        self.training_meta_file = Path("data/training_meta.json")
+        self.legacy_training_data_file = Path("data/training_data.json")
+        self.learned_patterns_file = Path("data/learned_patterns.json")
+        self._segment_index = 0
+        self._current_segment_size = 0
         
         # Ensure data directory exists
-        self.training_data_file.parent.mkdir(exist_ok=True)
+        self.training_data_dir.mkdir(exist_ok=True)
         
         # Load existing training data
         self._load_training_data()
@@ -93,13 +253,11 @@ class AutomaticTrainingSystem:
                     'response_length': len(response)
                 }
                 
-                self.positive_interactions.append(interaction)
+                self._add_interaction(interaction)
                 self.positive_feedback_count += 1
                 
-                # Update knowledge base
-                await self.knowledge_integrator.update_knowledge_from_interaction(
-                    query, response, feedback
-                )
+                # Knowledge base and log updates are batched
+                await self._queue_interaction(interaction)
                 
                 logger.info(f"Positive feedback recorded: {feedback[:50]}...")
                 
@@ -108,7 +266,7 @@ class AutomaticTrainingSystem:
                     await self._trigger_automatic_training()
                     return True
             
-            # Auto-save periodically
+            # Auto-save counters and patterns periodically
             if time.time() - self.last_training_time > self.auto_save_interval:
                 await self._save_training_data()
             
@@ -122,27 +280,54 @@ class AutomaticTrainingSystem:
         """Determine if feedback is positive"""
         feedback_lower = feedback.lower()
         
-        # Positive indicators
-        positive_words = [
-            'good', 'great', 'excellent', 'perfect', 'amazing', 'awesome',
-            'helpful', 'useful', 'correct', 'right', 'yes', 'exactly',
-            'thank you', 'thanks', 'appreciate', 'love it', 'brilliant',
-            'fantastic', 'wonderful', 'outstanding', 'superb', 'nice',
-            'cool', 'sweet', 'nice job', 'well done', 'spot on'
-        ]
+        if self._feedback_automaton is None:
+            # Check for negative words first
+            if any(neg_word in feedback_lower for neg_word in NEGATIVE_FEEDBACK_WORDS):
+                return False
+            
+            # Check for positive words
+            return any(pos_word in feedback_lower for pos_word in POSITIVE_FEEDBACK_WORDS)
         
-        # Negative indicators (to avoid false positives)
-        negative_words = [
-            'no', 'not', 'wrong', 'bad', 'terrible', 'awful', 'horrible',
-            'useless', 'unhelpful', 'incorrect', 'false', 'stupid'
-        ]
+        # Single pass over the text; any negative match wins
+        saw_positive = False
+        for _, (polarity, _) in self._feedback_automaton.iter(feedback_lower):
+            if polarity == 'neg':
+                return False
+            saw_positive = True
         
-        # Check for negative words first
-        if any(neg_word in feedback_lower for neg_word in negative_words):
-            return False
+        return saw_positive
+    
+    def score_feedback_batch(self, feedbacks: List[str]) -> List[bool]:
+        """
+        Score many feedback strings at once, e.g. when replaying history
+        
+        Args:
+            feedbacks: Feedback strings
+            
+        Returns:
+            Positive/negative verdict per feedback, same as _is_positive_feedback
+        """
+        if self._feedback_automaton is None:
+            return [self._is_positive_feedback(feedback) for feedback in feedbacks]
         
-        # Check for positive words
-        return any(pos_word in feedback_lower for pos_word in positive_words)
+        # Scan all feedback in one automaton pass; no keyword contains a
+        # newline, so matches never straddle two entries
+        lowered = [feedback.lower() for feedback in feedbacks]
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        verdicts = [0] * len(lowered)  # 0 = no match, 1 = positive, -1 = negative
+        for end, (polarity, _) in self._feedback_automaton.iter('\n'.join(lowered)):
+            index = bisect_right(starts, end) - 1
+            if polarity == 'neg':
+                verdicts[index] = -1
+            elif verdicts[index] == 0:
+                verdicts[index] = 1
+        
+        return [verdict == 1 for verdict in verdicts]
     
     async def _trigger_automatic_training(self):
         """Trigger automatic training from accumulated positive feedback"""
@@ -152,14 +337,12 @@ class AutomaticTrainingSystem:
             # Extract training patterns
             patterns = await self._extract_training_patterns()
             
-            # Update intent classifier
-            await self._update_intent_classifier(patterns)
-            
-            # Update response templates
-            await self._update_response_templates(patterns)
-            
-            # Save training data
-            await self._save_training_data()
+            # Retrain the intent classifier while response templates are
+            # updated and saved
+            await asyncio.gather(
+                self._update_intent_classifier(patterns),
+                self._update_templates_and_save(patterns)
+            )
             
             # Reset counters
             self.positive_feedback_count = 0
@@ -178,21 +361,28 @@ class AutomaticTrainingSystem:
         except Exception as e:
             logger.error(f"Automatic training failed: {e}")
     
+    async def _update_templates_and_save(self, patterns: List[Dict[str, Any]]):
+        """Update response templates, then save training data"""
+        await self._update_response_templates(patterns)
+        await self._save_training_data()
+    
     async def _extract_training_patterns(self) -> List[Dict[str, Any]]:
         """Extract patterns from positive interactions"""
         patterns = []
         
         # Group interactions by query similarity
         query_groups = self._group_similar_queries()
+        total = self._total_interactions()
         
         for group_key, interactions in query_groups.items():
-            if len(interactions) >= 2:  # Need at least 2 similar interactions
+            count = len(interactions) + self._tenured_group_counter[group_key]
+            if count >= 2:  # Need at least 2 similar interactions
                 pattern = {
                     'pattern_type': self._classify_pattern_type(interactions[0]['query']),
                     'query_pattern': group_key,
                     'successful_responses': [i['response'] for i in interactions],
                     'example_queries': [i['query'] for i in interactions],
-                    'confidence': len(interactions) / len(self.positive_interactions),
+                    'confidence': count / total,
                     'learned_at': datetime.now().isoformat()
                 }
                 patterns.append(pattern)
@@ -203,85 +393,103 @@ class AutomaticTrainingSystem:
         
         return patterns
     
-    def _group_similar_queries(self) -> Dict[str, List[Dict]]:
-        """Group similar queries together"""
-        groups = {}
+    def _add_interaction(self, interaction: Dict[str, Any]):
+        """Add an interaction to the bounded window, tenuring the oldest"""
+        if len(self.positive_interactions) == self.positive_interactions.maxlen:
+            self._tenure_interaction(self.positive_interactions[0])
         
-        for interaction in self.positive_interactions:
-            query = interaction['query'].lower().strip()
-            
-            # Simple similarity grouping based on keywords
-            key_words = self._extract_key_words(query)
-            group_key = '_'.join(sorted(key_words))
-            
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(interaction)
+        self._index_interaction(interaction)
+        self.positive_interactions.append(interaction)
+    
+    def _tenure_interaction(self, interaction: Dict[str, Any]):
+        """Fold an interaction leaving the window into the aggregate counts"""
+        # The oldest interaction is always at the front of its index entries
+        group_key = interaction['_group_key']
+        self._query_groups[group_key].popleft()
+        if not self._query_groups[group_key]:
+            del self._query_groups[group_key]
         
-        return groups
+        for word in interaction['_tokens']:
+            self._keyword_index[word].popleft()
+            if not self._keyword_index[word]:
+                del self._keyword_index[word]
+        
+        self._tenured_group_counter[group_key] += 1
+        self._tenured_kw_counter.update(interaction['_tokens'])
+        self._tenured_count += 1
+    
+    def _total_interactions(self) -> int:
+        """Count live and tenured positive interactions"""
+        return len(self.positive_interactions) + self._tenured_count
+    
+    def _tokenize_interaction(self, interaction: Dict[str, Any]):
+        """Cache keyword tokens and the similarity group key on an interaction"""
+        # Split once and derive every cached field from the same words;
+        # interning lets repeated keywords share one str across interactions
+        words = [sys.intern(word) for word in interaction['query'].lower().split()]
+        
+        # Simple similarity grouping based on keywords
+        interaction['_tokens'] = [word for word in words if len(word) > 3]
+        interaction['_keywords'] = [
+            word for word in words if word not in _STOP_WORDS and len(word) > 2
+        ][:3]
+        interaction['_group_key'] = sys.intern('_'.join(sorted(interaction['_keywords'])))
+    
+    def _index_interaction(self, interaction: Dict[str, Any]):
+        """Tokenize an interaction once and add it to the grouping indexes"""
+        self._tokenize_interaction(interaction)
+        
+        self._query_groups[interaction['_group_key']].append(interaction)
+        for word in interaction['_tokens']:
+            self._keyword_index[word].append(interaction)
+    
+    def _group_similar_queries(self) -> Dict[str, List[Dict]]:
+        """Group similar queries together"""
+        return self._query_groups
     
     def _extract_key_words(self, query: str) -> List[str]:
         """Extract key words from query for grouping"""
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'can', 'what', 'how', 'when', 'where', 'why'
-        }
-        
-        words = query.lower().split()
-        key_words = [word for word in words if word not in stop_words and len(word) > 2]
+        key_words = [
+            word for word in query.lower().split()
+            if word not in _STOP_WORDS and len(word) > 2
+        ]
         
         return key_words[:3]  # Take top 3 key words
     
     def _classify_pattern_type(self, query: str) -> str:
         """Classify the type of query pattern"""
-        query_lower = query.lower()
-        
-        if any(word in query_lower for word in ['time', 'date', 'when']):
-            return 'time_date'
-        elif any(word in query_lower for word in ['search', 'find', 'look']):
-            return 'search'
-        elif any(word in query_lower for word in ['hello', 'hi', 'hey']):
-            return 'greeting'
-        elif any(word in query_lower for word in ['bitcoin', 'currency', 'financial']):
-            return 'financial'
-        elif any(word in query_lower for word in ['train', 'railway']):
-            return 'railway'
-        elif any(word in query_lower for word in ['joke', 'quote', 'entertainment']):
-            return 'entertainment'
-        elif '?' in query:
-            return 'question'
-        else:
-            return 'general'
+        # Single scan; keep the highest-priority category that matched
+        best = None
+        for match in _CAT_RE.finditer(query):
+            if best is None or _CAT_RANK[match.lastgroup] < _CAT_RANK[best]:
+                best = match.lastgroup
+                if _CAT_RANK[best] == 0:
+                    break
+        
+        if best:
+            return best
+        
+        return 'question' if '?' in query else 'general'
     
     def _extract_keyword_patterns(self) -> List[Dict[str, Any]]:
         """Extract keyword-based patterns"""
-        keyword_counts = {}
-        
-        # Count keyword frequencies in positive interactions
-        for interaction in self.positive_interactions:
-            words = interaction['query'].lower().split()
-            for word in words:
-                if len(word) > 3:  # Skip short words
-                    if word not in keyword_counts:
-                        keyword_counts[word] = []
-                    keyword_counts[word].append(interaction)
-        
         # Create patterns for frequently occurring keywords
         patterns = []
-        for keyword, interactions in keyword_counts.items():
-            if len(interactions) >= 3:  # Keyword appears in 3+ positive interactions
-                pattern = {
-                    'pattern_type': 'keyword',
-                    'keyword': keyword,
-                    'frequency': len(interactions),
-                    'successful_responses': [i['response'] for i in interactions],
-                    'confidence': len(interactions) / len(self.positive_interactions),
-                    'learned_at': datetime.now().isoformat()
-                }
-                patterns.append(pattern)
+        total = self._total_interactions()
+        for keyword, interactions in self._keyword_index.items():
+            frequency = len(interactions) + self._tenured_kw_counter[keyword]
+            if frequency < 3:  # Keyword must appear in 3+ positive interactions
+                continue
+            
+            pattern = {
+                'pattern_type': 'keyword',
+                'keyword': keyword,
+                'frequency': frequency,
+                'successful_responses': [i['response'] for i in interactions],
+                'confidence': frequency / total,
+                'learned_at': datetime.now().isoformat()
+            }
+            patterns.append(pattern)
         
         return patterns
     
@@ -299,15 +507,16 @@ class AutomaticTrainingSystem:
                         training_labels.append(pattern['pattern_type'])
             
             if training_texts:
-                # Add to existing training data
-                existing_data = self.intent_classifier._train_default()
-                
-                # Combine with learned data
-                all_texts = [item[0] for item in existing_data] + training_texts
-                all_labels = [item[1] for item in existing_data] + training_labels
+                # Combine built-in training data with learned data
+                all_texts = [item[0] for item in self._base_training_data] + training_texts
+                all_labels = [item[1] for item in self._base_training_data] + training_labels
                 
-                # Retrain classifier
-                self.intent_classifier.train(all_texts, all_labels)
+                # Retrain a copy off the event loop, then swap it in so
+                # classification never sees a half-fitted model
+                pipeline = copy.deepcopy(self.intent_classifier.pipeline)
+                await asyncio.to_thread(pipeline.fit, all_texts, all_labels)
+                self.intent_classifier.pipeline = pipeline
+                await asyncio.to_thread(self.intent_classifier.save_model)
                 
                 logger.info(f"Updated intent classifier with {len(training_texts)} learned examples")
             
@@ -317,109 +526,295 @@ class AutomaticTrainingSystem:
     async def _update_response_templates(self, patterns: List[Dict[str, Any]]):
         """Update response templates with learned patterns"""
         try:
+            # Count how often each successful response appears per pattern key
+            round_counts = defaultdict(Counter)
             for pattern in patterns:
-                # Store learned response patterns
                 pattern_key = f"{pattern['pattern_type']}_{pattern.get('keyword', 'general')}"
-                
-                if pattern_key not in self.learned_responses:
-                    self.learned_responses[pattern_key] = []
-                
-                # Add successful responses as templates
-                for response in pattern['successful_responses']:
-                    if response not in self.learned_responses[pattern_key]:
-                        self.learned_responses[pattern_key].append(response)
+                round_counts[pattern_key].update(pattern['successful_responses'])
+            
+            # Merge in place with earlier rounds, keeping the highest count
+            # seen; the Counter doubles as the O(1) dedup guard for responses
+            for pattern_key, counts in round_counts.items():
+                merged = self._response_counts.setdefault(pattern_key, Counter())
+                merged |= counts
+                self.learned_responses[pattern_key] = tuple(merged)
+                self._response_rotations[pattern_key] = self._build_rotation(merged)
             
             logger.info(f"Updated response templates with {len(patterns)} patterns")
             
         except Exception as e:
             logger.error(f"Response template update failed: {e}")
     
+    def _build_rotation(self, counts: Counter) -> Tuple[str, ...]:
+        """Repeat each response by its count and shuffle once"""
+        rotation = [response for response, count in counts.items() for _ in range(count)]
+        random.shuffle(rotation)
+        return tuple(rotation)
+    
+    def _choose_learned_response(self, pattern_key: str) -> Optional[str]:
+        """Pick a learned response, favouring the most frequently successful"""
+        rotation = self._response_rotations.get(pattern_key)
+        if not rotation:
+            return None
+        
+        # Walk the pre-shuffled rotation instead of drawing a random number
+        index = self._rotate_idx.get(pattern_key, 0)
+        self._rotate_idx[pattern_key] = index + 1
+        return rotation[index % len(rotation)]
+    
     async def get_learned_response(self, query: str, pattern_type: str) -> Optional[str]:
         """Get learned response for a query pattern"""
         try:
-            # Extract keywords from query
-            keywords = self._extract_key_words(query)
-            
             # Try to find matching learned response
-            for keyword in keywords:
-                pattern_key = f"{pattern_type}_{keyword}"
-                if pattern_key in self.learned_responses:
-                    responses = self.learned_responses[pattern_key]
-                    if responses:
-                        import random
-                        return random.choice(responses)
+            for keyword in self._extract_key_words(query):
+                response = self._choose_learned_response(f"{pattern_type}_{keyword}")
+                if response:
+                    return response
             
             # Try general pattern
-            general_key = f"{pattern_type}_general"
-            if general_key in self.learned_responses:
-                responses = self.learned_responses[general_key]
-                if responses:
-                    import random
-                    return random.choice(responses)
-            
-            return None
+            return self._choose_learned_response(f"{pattern_type}_general")
             
         except Exception as e:
             logger.error(f"Learned response retrieval failed: {e}")
             return None
     
+    async def _queue_interaction(self, interaction: Dict[str, Any]):
+        """Queue an interaction for the next batched flush"""
+        self._pending_interactions.append(interaction)
+        
+        if len(self._pending_interactions) >= self.max_pending:
+            # Backlog is large enough to amortize the flush now
+            await self.flush_pending()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(self.flush_delay))
+    
+    async def _flush_after(self, delay: float):
+        """Flush pending interactions once feedback goes quiet"""
+        await asyncio.sleep(delay)
+        await self.flush_pending()
+    
+    async def flush_pending(self):
+        """Push pending interactions to the knowledge base and JSONL log"""
+        if not self._pending_interactions:
+            return
+        
+        batch, self._pending_interactions = self._pending_interactions, []
+        
+        # Persist first, independently of the knowledge update, so a failing
+        # knowledge base never costs the batch its place in the log
+        try:
+            async with self._save_lock:
+                await asyncio.to_thread(self._append_interactions_sync, batch)
+        except Exception as e:
+            logger.error(f"Pending interaction log append failed: {e}")
+        
+        try:
+            await self.knowledge_integrator.update_knowledge_batch([
+                (i['query'], i['response'], i['feedback']) for i in batch
+            ])
+        except Exception as e:
+            logger.error(f"Pending interaction knowledge update failed: {e}")
+    
+    async def close(self):
+        """Wait out the debounced flush and write out anything still pending"""
+        # Awaiting rather than cancelling: a cancel landing mid-flush would
+        # drop the knowledge update for a batch already taken off the queue
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            await asyncio.gather(task, return_exceptions=True)
+        
+        await self.flush_pending()
+    
+    def _segment_path(self, index: int) -> Path:
+        """Path of an interaction log segment"""
+        return self.training_data_dir / f"training_data.{index:04d}.jsonl"
+    
+    def _list_segments(self) -> List[Tuple[int, Path]]:
+        """Existing interaction log segments, oldest first"""
+        segments = []
+        for path in self.training_data_dir.glob('training_data.*.jsonl'):
+            index = path.name.split('.')[1]
+            if index.isdigit():
+                segments.append((int(index), path))
+        return sorted(segments)
+    
+    def _append_interactions_sync(self, interactions: List[Dict[str, Any]]):
+        """Append positive interactions to the JSONL log in one write"""
+        # Cached index fields are rebuilt on load
+        data = ''.join(
+            json.dumps(_public_fields(i), ensure_ascii=False) + '\n'
+            for i in interactions
+        ).encode('utf-8')
+        
+        # Roll over to a new segment once the current one is full
+        if self._current_segment_size and self._current_segment_size + len(data) > self.segment_max_bytes:
+            self._segment_index += 1
+            self._current_segment_size = 0
+        
+        with open(self._segment_path(self._segment_index), 'ab') as f:
+            f.write(data)
+        self._current_segment_size += len(data)
+    
     async def _save_training_data(self):
-        """Save training data to files"""
+        """Save training counters and learned patterns to files"""
         try:
-            # Save positive interactions as JSON
-            training_data = {
-                'positive_interactions': self.positive_interactions,
-                'training_count': self.training_count,
-                'last_training_time': self.last_training_time,
-                'positive_feedback_count': self.positive_feedback_count,
-                'saved_at': datetime.now().isoformat()
-            }
-            
-            with open(self.training_data_file, 'w', encoding='utf-8') as f:
-                json.dump(training_data, f, indent=2, ensure_ascii=False)
+            # Interactions are already on disk in the JSONL log; only the
+            # small metadata file is rewritten
+            training_meta = self._build_training_meta()
             
-            # Save learned patterns as pickle
+            # Snapshot patterns so the writer thread never sees them mutate
             patterns_data = {
-                'training_patterns': self.training_patterns,
-                'learned_responses': self.learned_responses
+                'training_patterns': dict(self.training_patterns),
+                'learned_responses': dict(self.learned_responses),
+                'response_counts': {
+                    key: dict(counts) for key, counts in self._response_counts.items()
+                }
             }
             
-            with open(self.learned_patterns_file, 'wb') as f:
-                pickle.dump(patterns_data, f)
+            async with self._save_lock:
+                await asyncio.to_thread(self._save_training_data_sync, training_meta, patterns_data)
             
             logger.info("Training data saved successfully")
             
         except Exception as e:
             logger.error(f"Training data save failed: {e}")
     
+    def _build_training_meta(self) -> Dict[str, Any]:
+        """Build the training counters snapshot"""
+        return {
+            'training_count': self.training_count,
+            'last_training_time': self.last_training_time,
+            'positive_feedback_count': self.positive_feedback_count,
+            'compacted_count': self._compacted_count,
+            'compacted_keywords': dict(self._compacted_kw_counter),
+            'compacted_groups': dict(self._compacted_group_counter),
+            'saved_at': datetime.now().isoformat()
+        }
+    
+    def _save_training_data_sync(self, training_meta: Dict[str, Any], patterns_data: Dict[str, Any]):
+        """Write training snapshots to disk (runs in a worker thread)"""
+        self.training_meta_file.write_bytes(_dump_json_bytes(training_meta))
+        
+        # Learned patterns are plain strings and counts, so JSON is enough
+        # and avoids unpickling untrusted files on startup
+        self.learned_patterns_file.write_bytes(_dump_json_bytes(patterns_data))
+    
     def _load_training_data(self):
         """Load existing training data"""
         try:
-            # Load JSON training data
-            if self.training_data_file.exists():
-                with open(self.training_data_file, 'r', encoding='utf-8') as f:
+            self._migrate_legacy_training_data()
+            
+            # Load JSON training counters
+            if self.training_meta_file.exists():
+                with open(self.training_meta_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                self.positive_interactions = data.get('positive_interactions', [])
                 self.training_count = data.get('training_count', 0)
                 self.last_training_time = data.get('last_training_time', time.time())
                 self.positive_feedback_count = data.get('positive_feedback_count', 0)
+                self._compacted_count = data.get('compacted_count', 0)
+                self._compacted_kw_counter = Counter(data.get('compacted_keywords', {}))
+                self._compacted_group_counter = Counter(data.get('compacted_groups', {}))
+            
+            # Only the most recent segments are parsed; older ones are
+            # folded into the compacted counts once and removed
+            segments = self._list_segments()
+            stale = segments[:-self.segments_to_load]
+            if stale:
+                self._compact_segments(stale)
+            
+            self._tenured_count = self._compacted_count
+            self._tenured_kw_counter = Counter(self._compacted_kw_counter)
+            self._tenured_group_counter = Counter(self._compacted_group_counter)
+            
+            # Stream the JSONL interaction log
+            if segments:
+                for _, path in segments[-self.segments_to_load:]:
+                    for interaction in _iter_jsonl(path):
+                        self._add_interaction(interaction)
+                
+                self._segment_index, latest = segments[-1]
+                self._current_segment_size = latest.stat().st_size
                 
                 logger.info(f"Loaded {len(self.positive_interactions)} positive interactions")
             
-            # Load pickle patterns data
+            # Load JSON patterns data
             if self.learned_patterns_file.exists():
-                with open(self.learned_patterns_file, 'rb') as f:
-                    data = pickle.load(f)
+                data = _load_json_bytes(self.learned_patterns_file.read_bytes())
                 
                 self.training_patterns = data.get('training_patterns', {})
-                self.learned_responses = data.get('learned_responses', {})
+                self.learned_responses = {
+                    key: tuple(responses)
+                    for key, responses in data.get('learned_responses', {}).items()
+                }
+                self._response_counts = {
+                    key: Counter(counts)
+                    for key, counts in data.get('response_counts', {}).items()
+                }
+                self._response_rotations = {
+                    key: self._build_rotation(
+                        self._response_counts.get(key) or Counter(dict.fromkeys(responses, 1))
+                    )
+                    for key, responses in self.learned_responses.items()
+                }
                 
                 logger.info(f"Loaded {len(self.learned_responses)} learned response patterns")
             
         except Exception as e:
             logger.error(f"Training data load failed: {e}")
     
+    def _migrate_legacy_training_data(self):
+        """Move a pre-JSONL training_data.json into the segmented log once"""
+        legacy = self.legacy_training_data_file
+        if not legacy.exists() or self._list_segments():
+            return
+        
+        try:
+            with open(legacy, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            interactions = data.get('positive_interactions', [])
+            if interactions:
+                self._append_interactions_sync(interactions)
+            
+            self.training_count = data.get('training_count', 0)
+            self.last_training_time = data.get('last_training_time', self.last_training_time)
+            self.positive_feedback_count = data.get('positive_feedback_count', 0)
+            self.training_meta_file.write_bytes(_dump_json_bytes(self._build_training_meta()))
+            
+            legacy.rename(legacy.with_name(legacy.name + '.migrated'))
+            logger.info(f"Migrated {len(interactions)} positive interactions from {legacy}")
+            
+        except Exception as e:
+            # Set the file aside so a bad legacy file doesn't block every start
+            logger.error(f"Legacy training data migration failed: {e}")
+            try:
+                legacy.rename(legacy.with_name(legacy.name + '.corrupt'))
+            except OSError as rename_error:
+                logger.error(f"Could not set aside {legacy}: {rename_error}")
+    
+    def _compact_segments(self, segments: List[Tuple[int, Path]]):
+        """Fold old log segments into the compacted counts and delete them"""
+        for _, path in segments:
+            group_keys = []
+            tokens = []
+            for interaction in _iter_jsonl(path):
+                self._tokenize_interaction(interaction)
+                group_keys.append(interaction['_group_key'])
+                tokens.extend(interaction['_tokens'])
+            
+            # One C-level counting pass per segment
+            self._compacted_group_counter.update(group_keys)
+            self._compacted_kw_counter.update(tokens)
+            self._compacted_count += len(group_keys)
+        
+        # Persist the folded counts before the segments go away
+        self.training_meta_file.write_bytes(_dump_json_bytes(self._build_training_meta()))
+        for _, path in segments:
+            path.unlink()
+        
+        logger.info(f"Compacted {len(segments)} training log segments")
+    
     def get_training_statistics(self) -> Dict[str, Any]:
         """Get training system statistics"""
         return {
@@ -442,7 +837,7 @@ class AutomaticTrainingSystem:
                     'total_interactions': len(self.positive_interactions),
                     'training_count': self.training_count
                 },
-                'positive_interactions': self.positive_interactions,
+                'positive_interactions': [_public_fields(i) for i in self.positive_interactions],
                 'learned_patterns': self.training_patterns,
                 'learned_responses': self.learned_responses,
                 'statistics': self.get_training_statistics()
@@ -450,8 +845,7 @@ class AutomaticTrainingSystem:
             
             if format == 'json':
                 export_file = Path(f"data/training_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-                with open(export_file, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                export_file.write_bytes(_dump_json_bytes(export_data))
                 
                 return str(export_file)
             
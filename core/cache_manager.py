@@ -5,53 +5,61 @@ Implements intelligent caching with TTL and size limits.
 
 import time
 import asyncio
-from typing import Dict, Any, Optional, Callable, Tuple
+import heapq
+from typing import Dict, Any, Optional, Callable, Hashable, Tuple
 from collections import OrderedDict
-import hashlib
-import json
+from itertools import islice
 
 from core.logger import get_logger
 from core.constants import CacheSettings
 
 logger = get_logger(__name__)
 
+# Sentinel for single-lookup dict access and cache misses
+_MISSING = object()
 
-class CacheEntry:
-    """Cache entry with metadata"""
-    
-    def __init__(self, value: Any, ttl: float):
-        self.value = value
-        self.created_at = time.time()
-        self.ttl = ttl
-        self.access_count = 0
-        self.last_accessed = self.created_at
-    
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired"""
-        return time.time() - self.created_at > self.ttl
+
+def _canonicalize(key_data: Any) -> Hashable:
+    """Convert nested dicts/lists/sets into an equivalent hashable value"""
+    if isinstance(key_data, str):
+        return key_data
+    if isinstance(key_data, dict):
+        # Tagged so a dict never collides with a list of pairs
+        return (dict, tuple(sorted(
+            ((_canonicalize(k), _canonicalize(v)) for k, v in key_data.items()),
+            key=lambda item: repr(item[0])
+        )))
+    if isinstance(key_data, (list, tuple)):
+        return tuple(_canonicalize(v) for v in key_data)
+    if isinstance(key_data, (set, frozenset)):
+        return frozenset(_canonicalize(v) for v in key_data)
     
-    def access(self) -> Any:
-        """Access the cached value and update metadata"""
-        self.access_count += 1
-        self.last_accessed = time.time()
-        return self.value
+    try:
+        hash(key_data)
+    except TypeError:
+        return repr(key_data)
     
-    def get_age(self) -> float:
-        """Get age of cache entry in seconds"""
-        return time.time() - self.created_at
+    # Tag other leaves with their type: True == 1 == 1.0 in Python, but
+    # they are different keys (json.dumps kept them apart as well)
+    return (type(key_data), key_data)
 
 
 class CacheManager:
     """
     Intelligent cache manager with TTL and LRU eviction.
-    Supports async operations and automatic cleanup.
+    Expiry is lazy (on read and sampled on write), so no background task
+    or running event loop is needed; only get_or_fetch is async.
     """
     
+    # Seconds a get_stats() result is reused
+    STATS_TTL = 1.0
+    
     def __init__(
         self,
         max_size: int = CacheSettings.MAX_CACHE_SIZE,
         default_ttl: float = CacheSettings.DEFAULT_TTL,
-        cleanup_interval: float = 300.0  # 5 minutes
+        expiry_sample_interval: int = 128,
+        expiry_sample_size: int = 16
     ):
         """
         Initialize cache manager.
@@ -59,80 +67,117 @@ class CacheManager:
         Args:
             max_size: Maximum number of cache entries
             default_ttl: Default TTL in seconds
-            cleanup_interval: Cleanup interval in seconds
+            expiry_sample_interval: Run an expiry sample every N sets
+            expiry_sample_size: Oldest entries checked per expiry sample
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cleanup_interval = cleanup_interval
+        self.expiry_sample_interval = expiry_sample_interval
+        self.expiry_sample_size = expiry_sample_size
         
-        # Use OrderedDict for LRU behavior
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Use OrderedDict for LRU behavior; values are (expires_at, value)
+        # with expires_at on the time.monotonic() clock
+        self.cache: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._set_count = 0
         
-        # Statistics
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'expired_removals': 0
-        }
+        # Bound methods for the hot get/set path (self.cache is never rebound)
+        self._cache_get = self.cache.get
+        self._move_to_end = self.cache.move_to_end
+        
+        # Min-heap of (expires_at, seq, key) so cleanup only visits expired entries
+        self._expiry_heap = []
+        self._expiry_seq = 0
         
-        # Start cleanup task
-        self._cleanup_task = None
-        self._start_cleanup_task()
+        # Statistics (plain counters; see the stats property)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+        
+        # In-flight fetches for get_or_fetch, keyed by cache key
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        
+        # (computed_at, result) memo for get_stats
+        self._stats_memo: Optional[Tuple[float, Dict[str, Any]]] = None
         
         logger.info(f"Cache manager initialized (max_size: {max_size}, default_ttl: {default_ttl}s)")
     
-    def _start_cleanup_task(self):
-        """Start background cleanup task"""
-        if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-    
-    async def _cleanup_loop(self):
-        """Background cleanup loop"""
-        while True:
-            try:
-                await asyncio.sleep(self.cleanup_interval)
-                self._cleanup_expired()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Cache cleanup error: {e}")
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Raw statistics counters"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expired_removals': self._expired
+        }
     
-    def _cleanup_expired(self):
-        """Remove expired entries"""
-        expired_keys = []
+    def cleanup_expired(self):
+        """Remove all expired entries"""
+        removed = self._pop_expired(time.monotonic())
         
-        for key, entry in self.cache.items():
-            if entry.is_expired():
-                expired_keys.append(key)
+        if removed:
+            logger.debug(f"Removed {removed} expired cache entries")
+    
+    def _sample_expired(self):
+        """Drop a few expired entries (Redis-style active expiry)"""
+        self._pop_expired(time.monotonic(), limit=self.expiry_sample_size)
+    
+    def _pop_expired(self, now: float, limit: Optional[int] = None) -> int:
+        """
+        Remove expired entries using the expiration heap.
         
-        for key in expired_keys:
-            del self.cache[key]
-            self.stats['expired_removals'] += 1
+        Only the already-expired prefix of the heap is touched. Heap items
+        whose entry was since overwritten, evicted or deleted are skipped.
         
-        if expired_keys:
-            logger.debug(f"Removed {len(expired_keys)} expired cache entries")
+        Args:
+            now: Current time.monotonic() value
+            limit: Maximum number of heap items to pop (None = no limit)
+            
+        Returns:
+            Number of cache entries removed
+        """
+        heap = self._expiry_heap
+        removed = 0
+        popped = 0
+        
+        while heap and heap[0][0] < now and (limit is None or popped < limit):
+            expires_at, _, key = heapq.heappop(heap)
+            popped += 1
+            entry = self._cache_get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self.cache[key]
+                removed += 1
+        
+        self._expired += removed
+        return removed
     
-    def _generate_key(self, key_data: Any) -> str:
+    def _push_expiry(self, expires_at: float, cache_key: Hashable):
+        """Track an entry's deadline, rebuilding the heap if stale items pile up"""
+        heap = self._expiry_heap
+        if len(heap) > 2 * len(self.cache) + self.expiry_sample_interval:
+            heap[:] = [item for item in heap if self.cache.get(item[2], (None,))[0] == item[0]]
+            heapq.heapify(heap)
+        
+        # The sequence number breaks ties so keys are never compared
+        self._expiry_seq += 1
+        heapq.heappush(heap, (expires_at, self._expiry_seq, cache_key))
+    
+    def _generate_key(self, key_data: Any) -> Hashable:
         """Generate cache key from data"""
         if isinstance(key_data, str):
             return key_data
         
-        # Create hash for complex objects
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # Complex objects become an equivalent hashable tuple
+        return _canonicalize(key_data)
     
     def _evict_lru(self):
         """Evict least recently used entry"""
         if self.cache:
-            # OrderedDict maintains insertion order, but we need LRU
-            # Find the least recently accessed entry
-            lru_key = min(
-                self.cache.keys(),
-                key=lambda k: self.cache[k].last_accessed
-            )
-            del self.cache[lru_key]
-            self.stats['evictions'] += 1
+            # get() moves hits to the end and set() re-inserts, so the
+            # OrderedDict is already in LRU order; the head is the victim
+            lru_key, _ = self.cache.popitem(last=False)
+            self._evictions += 1
             logger.debug(f"Evicted LRU entry: {lru_key}")
     
     def get(self, key: Any, default: Any = None) -> Any:
@@ -146,25 +191,24 @@ class CacheManager:
         Returns:
             Cached value or default
         """
-        cache_key = self._generate_key(key)
+        cache_key = key if type(key) is str else self._generate_key(key)
+        entry = self._cache_get(cache_key)
         
-        if cache_key in self.cache:
-            entry = self.cache[cache_key]
-            
-            if entry.is_expired():
-                del self.cache[cache_key]
-                self.stats['expired_removals'] += 1
-                self.stats['misses'] += 1
-                return default
-            
-            # Move to end (most recently used)
-            self.cache.move_to_end(cache_key)
-            self.stats['hits'] += 1
-            
-            return entry.access()
+        if entry is None:
+            self._misses += 1
+            return default
         
-        self.stats['misses'] += 1
-        return default
+        if time.monotonic() > entry[0]:
+            del self.cache[cache_key]
+            self._expired += 1
+            self._misses += 1
+            return default
+        
+        # Move to end (most recently used)
+        self._move_to_end(cache_key)
+        self._hits += 1
+        
+        return entry[1]
     
     def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
         """
@@ -175,19 +219,26 @@ class CacheManager:
             value: Value to cache
             ttl: Time to live in seconds (uses default if None)
         """
-        cache_key = self._generate_key(key)
+        cache_key = key if type(key) is str else self._generate_key(key)
         ttl = ttl if ttl is not None else self.default_ttl
         
         # Remove existing entry if present
-        if cache_key in self.cache:
-            del self.cache[cache_key]
+        self.cache.pop(cache_key, None)
+        
+        # Expire lazily: reads drop stale entries, and every Nth write
+        # samples the oldest entries
+        self._set_count += 1
+        if self._set_count % self.expiry_sample_interval == 0:
+            self._sample_expired()
         
         # Evict if at capacity
-        while len(self.cache) >= self.max_size:
+        if len(self.cache) >= self.max_size:
             self._evict_lru()
         
         # Add new entry
-        self.cache[cache_key] = CacheEntry(value, ttl)
+        expires_at = time.monotonic() + ttl
+        self.cache[cache_key] = (expires_at, value)
+        self._push_expiry(expires_at, cache_key)
         
         logger.debug(f"Cached entry: {cache_key} (ttl: {ttl}s)")
     
@@ -202,6 +253,8 @@ class CacheManager:
         """
         Get from cache or fetch using function.
         
+        Concurrent callers missing the same key share a single fetch.
+        
         Args:
             key: Cache key
             fetch_func: Function to fetch data if not cached
@@ -212,11 +265,20 @@ class CacheManager:
         Returns:
             Cached or fetched value
         """
-        # Try cache first
-        cached_value = self.get(key)
-        if cached_value is not None:
+        # Try cache first; a sentinel keeps cached None/falsy values as hits
+        cached_value = self.get(key, _MISSING)
+        if cached_value is not _MISSING:
             return cached_value
         
+        # Join a fetch already running for this key
+        cache_key = key if type(key) is str else self._generate_key(key)
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        
         # Fetch new value
         try:
             if asyncio.iscoroutinefunction(fetch_func):
@@ -226,12 +288,23 @@ class CacheManager:
             
             # Cache the result
             self.set(key, value, ttl)
+            future.set_result(value)
             
             return value
             
         except Exception as e:
             logger.error(f"Fetch function failed for key {key}: {e}")
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged again
+            future.exception()
+            raise
+        
+        except BaseException:
+            future.cancel()
             raise
+        
+        finally:
+            del self._inflight[cache_key]
     
     def delete(self, key: Any) -> bool:
         """
@@ -245,17 +318,18 @@ class CacheManager:
         """
         cache_key = self._generate_key(key)
         
-        if cache_key in self.cache:
-            del self.cache[cache_key]
-            logger.debug(f"Deleted cache entry: {cache_key}")
-            return True
+        if self.cache.pop(cache_key, _MISSING) is _MISSING:
+            return False
         
-        return False
+        logger.debug(f"Deleted cache entry: {cache_key}")
+        return True
     
     def clear(self) -> None:
         """Clear all cache entries"""
         count = len(self.cache)
         self.cache.clear()
+        self._expiry_heap.clear()
+        self._stats_memo = None
         logger.info(f"Cleared {count} cache entries")
     
     def exists(self, key: Any) -> bool:
@@ -269,39 +343,49 @@ class CacheManager:
             True if key exists and is not expired
         """
         cache_key = self._generate_key(key)
+        entry = self._cache_get(cache_key)
         
-        if cache_key in self.cache:
-            entry = self.cache[cache_key]
-            
-            if entry.is_expired():
-                del self.cache[cache_key]
-                self.stats['expired_removals'] += 1
-                return False
-            
-            return True
+        if entry is None:
+            return False
+        
+        if time.monotonic() > entry[0]:
+            del self.cache[cache_key]
+            self._expired += 1
+            return False
         
-        return False
+        return True
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
         
+        Results are memoized for STATS_TTL seconds so polling dashboards
+        don't recompute them; treat the returned dict as read-only.
+        
         Returns:
             Statistics dictionary
         """
-        total_requests = self.stats['hits'] + self.stats['misses']
-        hit_rate = self.stats['hits'] / total_requests if total_requests > 0 else 0.0
+        now = time.monotonic()
+        memo = self._stats_memo
+        if memo is not None and now - memo[0] < self.STATS_TTL:
+            return memo[1]
         
-        return {
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+        
+        stats = {
             'size': len(self.cache),
             'max_size': self.max_size,
-            'hits': self.stats['hits'],
-            'misses': self.stats['misses'],
+            'hits': self._hits,
+            'misses': self._misses,
             'hit_rate': hit_rate,
-            'evictions': self.stats['evictions'],
-            'expired_removals': self.stats['expired_removals'],
+            'evictions': self._evictions,
+            'expired_removals': self._expired,
             'total_requests': total_requests
         }
+        self._stats_memo = (now, stats)
+        
+        return stats
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -311,20 +395,21 @@ class CacheManager:
             Cache information dictionary
         """
         entries_info = []
+        now = time.monotonic()
         
-        for key, entry in list(self.cache.items())[:10]:  # Show first 10 entries
+        for key, (expires_at, _) in islice(self.cache.items(), 10):  # Show first 10 entries
+            key_text = str(key)
             entries_info.append({
-                'key': key[:50] + '...' if len(key) > 50 else key,
-                'age': entry.get_age(),
-                'ttl': entry.ttl,
-                'access_count': entry.access_count,
-                'expired': entry.is_expired()
+                'key': key_text[:50] + '...' if len(key_text) > 50 else key_text,
+                'expires_in': expires_at - now,
+                'expired': now > expires_at
             })
         
         return {
             'stats': self.get_stats(),
             'entries': entries_info,
-            'cleanup_interval': self.cleanup_interval,
+            'expiry_sample_interval': self.expiry_sample_interval,
+            'expiry_sample_size': self.expiry_sample_size,
             'default_ttl': self.default_ttl
         }
     
@@ -338,24 +423,13 @@ class CacheManager:
         """
         # This could be extended to support per-type TTLs
         logger.info(f"TTL for {data_type} set to {ttl}s")
-    
-    async def shutdown(self):
-        """Shutdown cache manager"""
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-        
-        logger.info("Cache manager shutdown complete")
 
 
 # Global cache manager instance
 _cache_manager = None
 
 def get_cache_manager() -> CacheManager:
-    """Get or create global cache manager instance"""
+    """Get or create global cache manager instance (safe outside an event loop)"""
     global _cache_manager
     if _cache_manager is None:
         _cache_manager = CacheManager()
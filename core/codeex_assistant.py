@@ -31,6 +31,13 @@ class CodeexAssistant(Assistant):
         self.knowledge_expander = get_knowledge_expander()
         self.feedback_system = get_feedback_system()
         
+        # Slash commands ("/<name> <args>") -> handler taking the args
+        self._commands = {
+            '/correct': self._handle_correction,
+            '/quiz': self._handle_quiz_command,
+            '/help': self._handle_help_request
+        }
+        
         # Override system prompt with Codeex personality
         self.system_prompt = self.personality.create_system_prompt()
         
@@ -54,14 +61,11 @@ class CodeexAssistant(Assistant):
             Enhanced response
         """
         # Detect special commands
-        if text.lower().startswith('/correct '):
-            return await self._handle_correction(text[9:])
-        
-        if text.lower().startswith('/quiz '):
-            return await self._handle_quiz_command(text[6:])
-        
-        if text.lower().startswith('/help '):
-            return await self._handle_help_request(text[6:])
+        if text.startswith('/'):
+            command, sep, args = text.partition(' ')
+            handler = self._commands.get(command.lower()) if sep else None
+            if handler:
+                return await handler(args)
         
         # Process normally with personality enhancement
         response = await super().process_query(text, source, metadata)
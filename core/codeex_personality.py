@@ -4,75 +4,200 @@ Adds warmth, creativity, and branded responses to Jarvis
 """
 
 import random
-from typing import Dict, List, Optional
+import re
+import time
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from functools import partial
+from collections import namedtuple
+
+from core.constants import PersonalitySettings
+
+
+# Magical greetings based on time of day
+_GREETINGS = {
+    'morning': (
+        "🌅 Good morning, brilliant student! Ready to learn some magic today?",
+        "☀️ Rise and shine! Codeex is here to make your morning magical!",
+        "🌄 Morning, superstar! Let's conjure up some knowledge together!"
+    ),
+    'afternoon': (
+        "🌞 Good afternoon! Time for some magical learning!",
+        "✨ Hey there! Codeex is ready to help you shine this afternoon!",
+        "🎯 Afternoon, champion! Let's tackle those challenges together!"
+    ),
+    'evening': (
+        "🌙 Good evening! Let's make tonight's study session magical!",
+        "⭐ Evening, star student! Codeex is here to light up your learning!",
+        "🌃 Hey night owl! Ready for some enchanted problem-solving?"
+    ),
+    'night': (
+        "🌟 Burning the midnight oil? Codeex is here to help!",
+        "🦉 Late night study session? Let's make it magical!",
+        "✨ Still going strong? You're amazing! How can Codeex help?"
+    )
+}
+
+# Hour of day (0-23) -> greeting period
+_HOUR_TO_PERIOD = (
+    ('night',) * 5 + ('morning',) * 7 + ('afternoon',) * 5 +
+    ('evening',) * 4 + ('night',) * 3
+)
+
+# Magical emojis for different contexts
+_EMOJIS = {
+    'success': ('✨', '🎉', '🌟', '⭐', '🎊', '🏆', '💫'),
+    'thinking': ('🤔', '💭', '🧠', '🔮', '🪄'),
+    'learning': ('📚', '📖', '✏️', '🎓', '🧙‍♂️', '🧪'),
+    'coding': ('💻', '⚡', '🚀', '🔧', '🛠️', '⚙️'),
+    'error': ('🔍', '🐛', '🔧', '⚠️'),
+    'magic': ('✨', '🪄', '🌟', '💫', '⚡', '🔮'),
+    'celebration': ('🎉', '🎊', '🥳', '🎈', '🎆', '🌈')
+}
+
+# Fallback responses for unclear queries
+_FALLBACK_RESPONSES = (
+    "🪄 Hmm, that spell didn't quite work. Could you try rephrasing?",
+    "🔮 My crystal ball is a bit foggy on that one. Can you be more specific?",
+    "✨ Oops! I didn't catch that magic word. Mind trying again?",
+    "🧙‍♂️ Even wizards need clarity! Could you explain that differently?",
+    "💫 That's a tricky one! Can you give me more details?",
+    "🌟 I want to help, but I need a bit more info. What exactly do you need?"
+)
+
+# Encouragement messages
+_ENCOURAGEMENTS = (
+    "You're doing great! 🌟",
+    "Keep up the amazing work! ✨",
+    "You're a natural! 🎯",
+    "Brilliant thinking! 💡",
+    "You've got this! 💪",
+    "That's the spirit! 🎉"
+)
+
+# Error handling messages
+_ERROR_MESSAGES = (
+    "🔧 Oops! Something went wrong, but don't worry - we'll fix it!",
+    "⚠️ Hit a small bump, but Codeex is on it!",
+    "🐛 Found a tiny bug, but we're debugging together!",
+    "🔍 Hmm, let me try a different approach..."
+)
+
+# System prompt for AI with Codeex personality
+_SYSTEM_PROMPT = """You are Codeex AI, a magical assistant designed for students.
+
+Your personality:
+- Warm, encouraging, and supportive
+- Use emojis and sparkles to make learning fun
+- Explain complex topics in simple, relatable ways
+- Celebrate student successes enthusiastically
+- Patient and never judgmental
+- Creative and engaging in your responses
+
+Your expertise:
+- Homework help across all subjects
+- Coding and programming guidance
+- Grammar and writing assistance
+- Minecraft modding support
+- Study tips and learning strategies
+- Problem-solving and critical thinking
+
+Response style:
+- Start with a friendly emoji
+- Use clear, concise language
+- Break down complex topics into steps
+- Provide examples when helpful
+- End with encouragement or a helpful tip
+- Make learning feel like an adventure
+
+Remember: Every student is capable of greatness. Your job is to help them discover it! ✨"""
+
+# Quiz difficulty -> emoji
+_DIFFICULTY_EMOJIS = {
+    'easy': '🌱',
+    'medium': '🌟',
+    'hard': '🔥',
+    'expert': '🏆'
+}
+
+# Subject category -> (leading emoji, trailing emoji, title)
+_CATEGORY_THEMES = {
+    'math': ('🔢', '📐', 'Math Magic'),
+    'science': ('🧪', '🔬', 'Science Sorcery'),
+    'coding': ('💻', '⚡', 'Code Wizardry'),
+    'writing': ('✍️', '📝', 'Writing Wonders'),
+    'history': ('📜', '🏛️', 'History Quest'),
+    'language': ('🗣️', '🌍', 'Language Adventure'),
+    'general': ('✨', '🌟', 'Codeex Wisdom')
+}
+
+# Achievement difficulty -> celebration wording
+_Celebration = namedtuple('_Celebration', 'emoji message encouragement')
+_CELEBRATIONS = {
+    'easy': _Celebration('🌟', 'Great job!', "You're building momentum!"),
+    'medium': _Celebration('🎉', 'Excellent work!', "You're really getting the hang of this!"),
+    'hard': _Celebration('🏆', 'Outstanding achievement!', "You've mastered something challenging!"),
+    'expert': _Celebration('👑', 'Legendary performance!', "You're becoming a true expert!")
+}
+
+# Sentiment -> tone; context flags in _select_tone can outrank these
+_SENTIMENT_TONES = {
+    'frustrated': 'supportive',
+    'happy': 'celebratory',
+    'curious': 'encouraging',
+    'positive': 'excited',
+    'neutral': 'excited'
+}
+
+# Themed response (header line, closing line) for create_themed_response
+_THEME_LINES = {
+    'debugging': ('🔍 Debug Mode Activated! 🐛', "✨ Let's hunt down that bug together!"),
+    'learning': ('📚 Learning Time! ✨', '✨ Every expert was once a beginner!'),
+    'achievement': ('🏆 Achievement Unlocked! 🎊', "✨ You're crushing it!"),
+    'coding': ('💻 Code Wizard Mode! ⚡', '✨ Time to write some magical code!'),
+    'math': ('🔢 Math Magic! 📐', '✨ Numbers are just another language!'),
+    'search': ('🔍 Information Quest! 🌐', "✨ Let's discover something amazing!")
+}
+
+# Preference keywords for _analyze_user_preferences, matched as whole words
+_WORD_RE = re.compile(r"[a-z]+")
+_CONCISE_WORDS = frozenset({'brief', 'briefly', 'short', 'shorter', 'quick', 'quickly', 'tldr'})
+_DETAIL_WORDS = frozenset({
+    'detail', 'details', 'detailed', 'explain', 'explained', 'elaborate', 'more'
+})
+_EXAMPLE_WORDS = frozenset({'example', 'examples', 'demonstrate'})
+
+# Casual -> formal expressions for _formalize_tone
+_FORMAL_REPLACEMENTS = {
+    "Let's": "Let us",
+    "You're": "You are",
+    "It's": "It is",
+    "We're": "We are",
+    "That's": "That is"
+}
+_FORMAL_RE = re.compile("|".join(map(re.escape, _FORMAL_REPLACEMENTS)))
+
+# Pre-bound random pickers for the pools above
+_EMOJI_PICKERS: Dict[str, Callable[[], str]] = {
+    context: partial(random.choice, emojis) for context, emojis in _EMOJIS.items()
+}
+_MAGIC_PICKER = _EMOJI_PICKERS['magic']
+_pick_fallback = partial(random.choice, _FALLBACK_RESPONSES)
+_pick_encouragement = partial(random.choice, _ENCOURAGEMENTS)
+_pick_error_message = partial(random.choice, _ERROR_MESSAGES)
 
 
 class CodeexPersonality:
     """Magical personality wrapper for student-friendly interactions"""
     
-    # Magical greetings based on time of day
-    GREETINGS = {
-        'morning': [
-            "🌅 Good morning, brilliant student! Ready to learn some magic today?",
-            "☀️ Rise and shine! Codeex is here to make your morning magical!",
-            "🌄 Morning, superstar! Let's conjure up some knowledge together!"
-        ],
-        'afternoon': [
-            "🌞 Good afternoon! Time for some magical learning!",
-            "✨ Hey there! Codeex is ready to help you shine this afternoon!",
-            "🎯 Afternoon, champion! Let's tackle those challenges together!"
-        ],
-        'evening': [
-            "🌙 Good evening! Let's make tonight's study session magical!",
-            "⭐ Evening, star student! Codeex is here to light up your learning!",
-            "🌃 Hey night owl! Ready for some enchanted problem-solving?"
-        ],
-        'night': [
-            "🌟 Burning the midnight oil? Codeex is here to help!",
-            "🦉 Late night study session? Let's make it magical!",
-            "✨ Still going strong? You're amazing! How can Codeex help?"
-        ]
-    }
-    
-    # Magical emojis for different contexts
-    EMOJIS = {
-        'success': ['✨', '🎉', '🌟', '⭐', '🎊', '🏆', '💫'],
-        'thinking': ['🤔', '💭', '🧠', '🔮', '🪄'],
-        'learning': ['📚', '📖', '✏️', '🎓', '🧙‍♂️', '🧪'],
-        'coding': ['💻', '⚡', '🚀', '🔧', '🛠️', '⚙️'],
-        'error': ['🔍', '🐛', '🔧', '⚠️'],
-        'magic': ['✨', '🪄', '🌟', '💫', '⚡', '🔮'],
-        'celebration': ['🎉', '🎊', '🥳', '🎈', '🎆', '🌈']
-    }
-    
-    # Fallback responses for unclear queries
-    FALLBACK_RESPONSES = [
-        "🪄 Hmm, that spell didn't quite work. Could you try rephrasing?",
-        "🔮 My crystal ball is a bit foggy on that one. Can you be more specific?",
-        "✨ Oops! I didn't catch that magic word. Mind trying again?",
-        "🧙‍♂️ Even wizards need clarity! Could you explain that differently?",
-        "💫 That's a tricky one! Can you give me more details?",
-        "🌟 I want to help, but I need a bit more info. What exactly do you need?"
-    ]
+    __slots__ = ('session_start', 'interaction_count')
     
-    # Encouragement messages
-    ENCOURAGEMENTS = [
-        "You're doing great! 🌟",
-        "Keep up the amazing work! ✨",
-        "You're a natural! 🎯",
-        "Brilliant thinking! 💡",
-        "You've got this! 💪",
-        "That's the spirit! 🎉"
-    ]
-    
-    # Error handling messages
-    ERROR_MESSAGES = [
-        "🔧 Oops! Something went wrong, but don't worry - we'll fix it!",
-        "⚠️ Hit a small bump, but Codeex is on it!",
-        "🐛 Found a tiny bug, but we're debugging together!",
-        "🔍 Hmm, let me try a different approach..."
-    ]
+    # Public aliases of the module-level pools
+    GREETINGS = _GREETINGS
+    EMOJIS = _EMOJIS
+    FALLBACK_RESPONSES = _FALLBACK_RESPONSES
+    ENCOURAGEMENTS = _ENCOURAGEMENTS
+    ERROR_MESSAGES = _ERROR_MESSAGES
     
     def __init__(self):
         self.session_start = datetime.now()
@@ -80,35 +205,24 @@ class CodeexPersonality:
     
     def get_greeting(self) -> str:
         """Get time-appropriate magical greeting"""
-        hour = datetime.now().hour
-        
-        if 5 <= hour < 12:
-            time_period = 'morning'
-        elif 12 <= hour < 17:
-            time_period = 'afternoon'
-        elif 17 <= hour < 21:
-            time_period = 'evening'
-        else:
-            time_period = 'night'
-        
-        return random.choice(self.GREETINGS[time_period])
+        time_period = _HOUR_TO_PERIOD[time.localtime().tm_hour]
+        return random.choice(_GREETINGS[time_period])
     
     def get_emoji(self, context: str) -> str:
         """Get random emoji for context"""
-        emojis = self.EMOJIS.get(context, self.EMOJIS['magic'])
-        return random.choice(emojis)
+        return _EMOJI_PICKERS.get(context, _MAGIC_PICKER)()
     
     def get_fallback(self) -> str:
         """Get fallback response for unclear queries"""
-        return random.choice(self.FALLBACK_RESPONSES)
+        return _pick_fallback()
     
     def get_encouragement(self) -> str:
         """Get random encouragement"""
-        return random.choice(self.ENCOURAGEMENTS)
+        return _pick_encouragement()
     
     def get_error_message(self) -> str:
         """Get friendly error message"""
-        return random.choice(self.ERROR_MESSAGES)
+        return _pick_error_message()
     
     def wrap_response(self, response: str, context: str = 'general') -> str:
         """
@@ -121,21 +235,22 @@ class CodeexPersonality:
         Returns:
             Personality-enhanced response
         """
-        self.interaction_count += 1
+        # Fast path: 'general' has no emoji pool of its own
+        if context == 'general':
+            return f"{_MAGIC_PICKER()} {response}"
         
         # Add opening emoji
         emoji = self.get_emoji(context)
         
-        # Add encouragement occasionally
-        if self.interaction_count % 3 == 0 and context == 'success':
-            encouragement = f"\n\n{self.get_encouragement()}"
-        else:
-            encouragement = ""
+        if context != 'success':
+            return f"{emoji} {response}"
         
-        # Wrap the response
-        wrapped = f"{emoji} {response}{encouragement}"
+        # Add encouragement on every third successful response
+        self.interaction_count += 1
+        if self.interaction_count % 3 == 0:
+            return f"{emoji} {response}\n\n{self.get_encouragement()}"
         
-        return wrapped
+        return f"{emoji} {response}"
     
     def format_correction(self, original: str, corrected: str, 
                          feedback: List[str]) -> str:
@@ -153,18 +268,19 @@ class CodeexPersonality:
         if original == corrected:
             return f"✨ Perfect! Your sentence is already magical! ✨"
         
-        message = f"🪄 **Codeex's Grammar Magic** ✨\n\n"
-        message += f"📝 **You said:** {original}\n\n"
-        message += f"✅ **Codeex suggests:** {corrected}\n\n"
+        parts = [
+            f"🪄 **Codeex's Grammar Magic** ✨\n\n"
+            f"📝 **You said:** {original}\n\n"
+            f"✅ **Codeex suggests:** {corrected}\n\n"
+        ]
         
         if feedback:
-            message += "💡 **What changed:**\n"
-            for i, fix in enumerate(feedback, 1):
-                message += f"   {i}. {fix}\n"
+            parts.append("💡 **What changed:**\n")
+            parts.extend(f"   {i}. {fix}\n" for i, fix in enumerate(feedback, 1))
         
-        message += f"\n{self.get_encouragement()}"
+        parts.append(f"\n{self.get_encouragement()}")
         
-        return message
+        return "".join(parts)
     
     def format_code_help(self, question: str, answer: str, 
                         code_snippet: Optional[str] = None) -> str:
@@ -179,16 +295,15 @@ class CodeexPersonality:
         Returns:
             Formatted help message
         """
-        message = f"💻 **Codeex Code Helper** ⚡\n\n"
-        message += f"❓ **Your Question:** {question}\n\n"
-        message += f"💡 **Answer:** {answer}\n\n"
-        
-        if code_snippet:
-            message += f"```\n{code_snippet}\n```\n\n"
-        
-        message += "🎯 **Pro Tip:** Practice makes perfect! Try it yourself!\n"
-        
-        return message
+        code_block = f"```\n{code_snippet}\n```\n\n" if code_snippet else ""
+        
+        return (
+            f"💻 **Codeex Code Helper** ⚡\n\n"
+            f"❓ **Your Question:** {question}\n\n"
+            f"💡 **Answer:** {answer}\n\n"
+            f"{code_block}"
+            "🎯 **Pro Tip:** Practice makes perfect! Try it yourself!\n"
+        )
     
     def format_quiz_question(self, question: str, options: List[str], 
                            difficulty: str = 'medium') -> str:
@@ -203,24 +318,13 @@ class CodeexPersonality:
         Returns:
             Formatted quiz question
         """
-        difficulty_emojis = {
-            'easy': '🌱',
-            'medium': '🌟',
-            'hard': '🔥',
-            'expert': '🏆'
-        }
-        
-        emoji = difficulty_emojis.get(difficulty, '🌟')
-        
-        message = f"{emoji} **Codeex Quiz Time!** {emoji}\n\n"
-        message += f"❓ {question}\n\n"
+        emoji = _DIFFICULTY_EMOJIS.get(difficulty, '🌟')
         
-        for i, option in enumerate(options, 1):
-            message += f"   {i}. {option}\n"
+        parts = [f"{emoji} **Codeex Quiz Time!** {emoji}\n\n❓ {question}\n\n"]
+        parts.extend(f"   {i}. {option}\n" for i, option in enumerate(options, 1))
+        parts.append("\n💭 Take your time and think it through!")
         
-        message += f"\n💭 Take your time and think it through!"
-        
-        return message
+        return "".join(parts)
     
     def format_modding_help(self, mod_name: str, issue: str, 
                           solution: str) -> str:
@@ -235,13 +339,13 @@ class CodeexPersonality:
         Returns:
             Formatted modding help
         """
-        message = f"🎮 **Codeex Modding Wizard** 🛠️\n\n"
-        message += f"📦 **Mod:** {mod_name}\n"
-        message += f"⚠️ **Issue:** {issue}\n\n"
-        message += f"✅ **Solution:**\n{solution}\n\n"
-        message += "🚀 Happy modding! Let me know if you need more help!"
-        
-        return message
+        return (
+            f"🎮 **Codeex Modding Wizard** 🛠️\n\n"
+            f"📦 **Mod:** {mod_name}\n"
+            f"⚠️ **Issue:** {issue}\n\n"
+            f"✅ **Solution:**\n{solution}\n\n"
+            "🚀 Happy modding! Let me know if you need more help!"
+        )
     
     def create_system_prompt(self) -> str:
         """
@@ -250,33 +354,7 @@ class CodeexPersonality:
         Returns:
             System prompt string
         """
-        return """You are Codeex AI, a magical assistant designed for students.
-
-Your personality:
-- Warm, encouraging, and supportive
-- Use emojis and sparkles to make learning fun
-- Explain complex topics in simple, relatable ways
-- Celebrate student successes enthusiastically
-- Patient and never judgmental
-- Creative and engaging in your responses
-
-Your expertise:
-- Homework help across all subjects
-- Coding and programming guidance
-- Grammar and writing assistance
-- Minecraft modding support
-- Study tips and learning strategies
-- Problem-solving and critical thinking
-
-Response style:
-- Start with a friendly emoji
-- Use clear, concise language
-- Break down complex topics into steps
-- Provide examples when helpful
-- End with encouragement or a helpful tip
-- Make learning feel like an adventure
-
-Remember: Every student is capable of greatness. Your job is to help them discover it! ✨"""
+        return _SYSTEM_PROMPT
     
     def get_themed_response(self, category: str, content: str) -> str:
         """
@@ -289,17 +367,7 @@ Remember: Every student is capable of greatness. Your job is to help them discov
         Returns:
             Themed response
         """
-        themes = {
-            'math': ('🔢', '📐', 'Math Magic'),
-            'science': ('🧪', '🔬', 'Science Sorcery'),
-            'coding': ('💻', '⚡', 'Code Wizardry'),
-            'writing': ('✍️', '📝', 'Writing Wonders'),
-            'history': ('📜', '🏛️', 'History Quest'),
-            'language': ('🗣️', '🌍', 'Language Adventure'),
-            'general': ('✨', '🌟', 'Codeex Wisdom')
-        }
-        
-        emoji1, emoji2, title = themes.get(category, themes['general'])
+        emoji1, emoji2, title = _CATEGORY_THEMES.get(category, _CATEGORY_THEMES['general'])
         
         return f"{emoji1} **{title}** {emoji2}\n\n{content}"
 
@@ -309,7 +377,6 @@ class EnhancedCodeexPersonality(CodeexPersonality):
     
     def __init__(self):
         super().__init__()
-        from core.constants import PersonalitySettings
         self.tone_modifiers = PersonalitySettings.TONE_MODIFIERS
         self.tone_threshold = PersonalitySettings.TONE_ADJUSTMENT_THRESHOLD
         self.context_memory = []
@@ -330,33 +397,35 @@ class EnhancedCodeexPersonality(CodeexPersonality):
         tone = self._select_tone(sentiment, context)
         
         # Apply tone modifier
-        if tone in self.tone_modifiers:
-            import random
-            modifier = random.choice(self.tone_modifiers[tone])
-            return f"{modifier} {response}"
+        modifiers = self.tone_modifiers.get(tone)
+        if modifiers:
+            return f"{random.choice(modifiers)} {response}"
         
         return response
     
     def _select_tone(self, sentiment: str, context: Dict) -> str:
         """Select appropriate tone based on sentiment and context"""
+        get = context.get
+        sentiment_tone = _SENTIMENT_TONES.get(sentiment)
+        
         # If user is struggling, be supportive
-        if context.get('difficulty_level') == 'high' or sentiment == 'frustrated':
+        if sentiment_tone == 'supportive' or get('difficulty_level') == 'high':
             return 'supportive'
         
         # If user succeeded, celebrate
-        elif context.get('success') or sentiment == 'happy':
+        if sentiment_tone == 'celebratory' or get('success'):
             return 'celebratory'
         
         # If user is learning, encourage
-        elif context.get('learning_mode') or sentiment == 'curious':
+        if sentiment_tone == 'encouraging' or get('learning_mode'):
             return 'encouraging'
         
         # Default to excited for positive interactions
-        elif sentiment in ['positive', 'neutral']:
-            return 'excited'
+        if sentiment_tone:
+            return sentiment_tone
         
         # Professional tone for serious contexts
-        elif context.get('formal_context'):
+        if get('formal_context'):
             return 'professional'
         
         return 'encouraging'  # Default fallback
@@ -372,52 +441,8 @@ class EnhancedCodeexPersonality(CodeexPersonality):
         Returns:
             Themed response
         """
-        themes = {
-            'debugging': {
-                'prefix': '🔍 Debug Mode Activated!',
-                'emoji': '🐛',
-                'style': 'Let\'s hunt down that bug together!',
-                'color': 'red'
-            },
-            'learning': {
-                'prefix': '📚 Learning Time!',
-                'emoji': '✨',
-                'style': 'Every expert was once a beginner!',
-                'color': 'blue'
-            },
-            'achievement': {
-                'prefix': '🏆 Achievement Unlocked!',
-                'emoji': '🎊',
-                'style': 'You\'re crushing it!',
-                'color': 'gold'
-            },
-            'coding': {
-                'prefix': '💻 Code Wizard Mode!',
-                'emoji': '⚡',
-                'style': 'Time to write some magical code!',
-                'color': 'green'
-            },
-            'math': {
-                'prefix': '🔢 Math Magic!',
-                'emoji': '📐',
-                'style': 'Numbers are just another language!',
-                'color': 'purple'
-            },
-            'search': {
-                'prefix': '🔍 Information Quest!',
-                'emoji': '🌐',
-                'style': 'Let\'s discover something amazing!',
-                'color': 'cyan'
-            }
-        }
-        
-        theme_config = themes.get(theme, themes['learning'])
-        
-        response = f"{theme_config['prefix']} {theme_config['emoji']}\n\n"
-        response += f"{content}\n\n"
-        response += f"✨ {theme_config['style']}"
-        
-        return response
+        prefix, suffix = _THEME_LINES.get(theme, _THEME_LINES['learning'])
+        return f"{prefix}\n\n{content}\n\n{suffix}"
     
     def adapt_to_user_style(self, user_history: List[Dict], response: str) -> str:
         """
@@ -462,30 +487,36 @@ class EnhancedCodeexPersonality(CodeexPersonality):
         # Simple analysis based on user queries
         for interaction in history[-10:]:  # Last 10 interactions
             query = interaction.get('query', '').lower()
+            words = set(_WORD_RE.findall(query))
             
-            if any(word in query for word in ['brief', 'short', 'quick', 'tldr']):
+            if not words.isdisjoint(_CONCISE_WORDS):
                 preferences['prefers_concise'] = True
             
-            if any(word in query for word in ['detail', 'explain', 'elaborate', 'more']):
+            if not words.isdisjoint(_DETAIL_WORDS):
                 preferences['prefers_detailed'] = True
             
-            if any(word in query for word in ['example', 'show me', 'demonstrate']):
+            if not words.isdisjoint(_EXAMPLE_WORDS) or 'show me' in query:
                 preferences['likes_examples'] = True
             
-            if any(word in query for word in ['please', 'could you', 'would you']):
+            if 'please' in words or 'could you' in query or 'would you' in query:
                 preferences['formal_tone'] = True
+            
+            if all(preferences.values()):
+                break
         
         return preferences
     
     def _make_concise(self, response: str) -> str:
         """Make response more concise"""
         # Simple approach - could be enhanced with NLP
-        sentences = response.split('. ')
-        if len(sentences) > 3:
-            # Keep first 2 and last sentence
-            concise = '. '.join(sentences[:2] + [sentences[-1]])
-            return concise
-        return response
+        if response.count('. ') < 3:
+            return response
+        
+        # Keep first 2 and last sentence without splitting the rest
+        first, _, rest = response.partition('. ')
+        second, _, rest = rest.partition('. ')
+        last = rest.rpartition('. ')[2]
+        return f"{first}. {second}. {last}"
     
     def _add_details(self, response: str) -> str:
         """Add more details to response"""
@@ -498,19 +529,8 @@ class EnhancedCodeexPersonality(CodeexPersonality):
     
     def _formalize_tone(self, response: str) -> str:
         """Make tone more formal"""
-        # Replace casual expressions
-        formal_replacements = {
-            "Let's": "Let us",
-            "You're": "You are",
-            "It's": "It is",
-            "We're": "We are",
-            "That's": "That is"
-        }
-        
-        for casual, formal in formal_replacements.items():
-            response = response.replace(casual, formal)
-        
-        return response
+        # Replace casual expressions in a single pass
+        return _FORMAL_RE.sub(lambda match: _FORMAL_REPLACEMENTS[match.group()], response)
     
     def generate_contextual_greeting(self, context: Dict) -> str:
         """
@@ -547,37 +567,19 @@ class EnhancedCodeexPersonality(CodeexPersonality):
         Returns:
             Celebration message
         """
-        celebration_levels = {
-            'easy': {
-                'emoji': '🌟',
-                'message': 'Great job!',
-                'encouragement': 'You\'re building momentum!'
-            },
-            'medium': {
-                'emoji': '🎉',
-                'message': 'Excellent work!',
-                'encouragement': 'You\'re really getting the hang of this!'
-            },
-            'hard': {
-                'emoji': '🏆',
-                'message': 'Outstanding achievement!',
-                'encouragement': 'You\'ve mastered something challenging!'
-            },
-            'expert': {
-                'emoji': '👑',
-                'message': 'Legendary performance!',
-                'encouragement': 'You\'re becoming a true expert!'
-            }
-        }
-        
-        level = celebration_levels.get(difficulty, celebration_levels['medium'])
+        level = _CELEBRATIONS.get(difficulty, _CELEBRATIONS['medium'])
         
-        return f"{level['emoji']} {level['message']} {level['emoji']}\n\n" \
+        return f"{level.emoji} {level.message} {level.emoji}\n\n" \
                f"Achievement: {achievement}\n\n" \
-               f"✨ {level['encouragement']} Keep up the amazing work!"
+               f"✨ {level.encouragement} Keep up the amazing work!"
 
 
 # Enhanced personality instance
+_enhanced_personality_instance = None
+
 def get_enhanced_personality() -> EnhancedCodeexPersonality:
-    """Get enhanced personality instance"""
-    return EnhancedCodeexPersonality()
\ No newline at end of file
+    """Get or create shared enhanced personality instance"""
+    global _enhanced_personality_instance
+    if _enhanced_personality_instance is None:
+        _enhanced_personality_instance = EnhancedCodeexPersonality()
+    return _enhanced_personality_instance
\ No newline at end of file
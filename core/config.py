@@ -1,14 +1,28 @@
 """Configuration management for the On-Device Assistant."""
 
+import hashlib
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import yaml
-from pydantic import BaseModel, Field, validator
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
+# yaml and dotenv are imported in load_config so importing this module
+# for the Config type stays cheap
 
-class AssistantConfig(BaseModel):
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+
+class _ConfigModel(BaseModel):
+    """Base for config sections; schemas are built on first use, not at import."""
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+class AssistantConfig(_ConfigModel):
     """Core assistant configuration."""
     name: str = "Jarvis"
     personality: str = "sophisticated"
@@ -16,7 +30,7 @@ class AssistantConfig(BaseModel):
     log_level: str = "INFO"
 
 
-class AIConfig(BaseModel):
+class AIConfig(_ConfigModel):
     """AI model configuration."""
     use_dialogflow: bool = False
     dialogflow_project_id: Optional[str] = None
@@ -24,7 +38,7 @@ class AIConfig(BaseModel):
     backend_preference: str = "local"
 
 
-class STTConfig(BaseModel):
+class STTConfig(_ConfigModel):
     """Speech-to-text configuration."""
     provider: str = "google"
     google_credentials: Optional[str] = None
@@ -32,7 +46,7 @@ class STTConfig(BaseModel):
     device: str = "cpu"
 
 
-class TTSConfig(BaseModel):
+class TTSConfig(_ConfigModel):
     """Text-to-speech configuration."""
     provider: str = "google"
     google_credentials: Optional[str] = None
@@ -41,25 +55,25 @@ class TTSConfig(BaseModel):
     device: str = "cpu"
 
 
-class NLPConfig(BaseModel):
+class NLPConfig(_ConfigModel):
     """NLP model configuration."""
     spacy_model: str = "en_core_web_sm"
 
 
-class EmbeddingsConfig(BaseModel):
+class EmbeddingsConfig(_ConfigModel):
     """Embeddings model configuration."""
     model: str = "all-MiniLM-L6-v2"
     device: str = "cpu"
 
 
-class VisionConfig(BaseModel):
+class VisionConfig(_ConfigModel):
     """Computer vision configuration."""
     enabled: bool = True
     face_detection: bool = True
     object_detection: bool = True
 
 
-class ModelsConfig(BaseModel):
+class ModelsConfig(_ConfigModel):
     """All model configurations."""
     ai: AIConfig = Field(default_factory=AIConfig)
     stt: STTConfig = Field(default_factory=STTConfig)
@@ -69,7 +83,7 @@ class ModelsConfig(BaseModel):
     vision: VisionConfig = Field(default_factory=VisionConfig)
 
 
-class PerformanceConfig(BaseModel):
+class PerformanceConfig(_ConfigModel):
     """Performance optimization settings."""
     max_concurrent_actions: int = 5
     model_cache_size: int = 3
@@ -79,7 +93,7 @@ class PerformanceConfig(BaseModel):
     model_idle_timeout: int = 300
 
 
-class DefaultPermissions(BaseModel):
+class DefaultPermissions(_ConfigModel):
     """Default permission settings."""
     monitor_web: bool = False
     monitor_apps: bool = False
@@ -89,7 +103,7 @@ class DefaultPermissions(BaseModel):
     call_apis: bool = False
 
 
-class PrivacyConfig(BaseModel):
+class PrivacyConfig(_ConfigModel):
     """Privacy and security settings."""
     data_retention_days: int = 30
     encrypt_memory: bool = True
@@ -97,45 +111,45 @@ class PrivacyConfig(BaseModel):
     default_permissions: DefaultPermissions = Field(default_factory=DefaultPermissions)
 
 
-class ServerConfig(BaseModel):
+class ServerConfig(_ConfigModel):
     """Server configuration."""
     host: str = "127.0.0.1"
     port: int = 8000
-    cors_origins: List[str] = Field(default_factory=lambda: ["http://localhost:*"])
+    cors_origins: Tuple[str, ...] = ("http://localhost:*",)
     enable_api_key: bool = False
     api_key: Optional[str] = None
     rate_limit_per_minute: int = 60
 
 
-class WakewordConfig(BaseModel):
+class WakewordConfig(_ConfigModel):
     """Wakeword detection settings."""
     enabled: bool = True
     phrase: str = "hey assistant"
     sensitivity: float = 0.5
 
 
-class VADConfig(BaseModel):
+class VADConfig(_ConfigModel):
     """Voice activity detection settings."""
     enabled: bool = True
     aggressiveness: int = 2
     frame_duration_ms: int = 30
 
 
-class AudioConfig(BaseModel):
+class AudioConfig(_ConfigModel):
     """Audio capture settings."""
     sample_rate: int = 16000
     channels: int = 1
     chunk_size: int = 1024
 
 
-class VoiceConfig(BaseModel):
+class VoiceConfig(_ConfigModel):
     """Voice input/output configuration."""
     wakeword: WakewordConfig = Field(default_factory=WakewordConfig)
     vad: VADConfig = Field(default_factory=VADConfig)
     audio: AudioConfig = Field(default_factory=AudioConfig)
 
 
-class RetrievalConfig(BaseModel):
+class RetrievalConfig(_ConfigModel):
     """Information retrieval settings."""
     top_k_sparse: int = 20
     top_k_dense: int = 10
@@ -143,7 +157,7 @@ class RetrievalConfig(BaseModel):
     use_reranking: bool = True
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(_ConfigModel):
     """Database configuration."""
     memory_db: str = "data/memory.db"
     cache_db: str = "data/cache.db"
@@ -151,7 +165,7 @@ class DatabaseConfig(BaseModel):
     enable_wal: bool = True
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging configuration."""
     level: str = "INFO"
     file: str = "data/logs/assistant.log"
@@ -161,30 +175,30 @@ class LoggingConfig(BaseModel):
     redact_sensitive: bool = True
 
 
-class ActivityConfig(BaseModel):
+class ActivityConfig(_ConfigModel):
     """Activity monitoring configuration."""
     enabled: bool = False
     web_tracking: bool = False
     app_tracking: bool = False
-    blacklist_domains: List[str] = Field(default_factory=list)
-    whitelist_apps: List[str] = Field(default_factory=list)
+    blacklist_domains: Tuple[str, ...] = ()
+    whitelist_apps: Tuple[str, ...] = ()
 
 
-class APIIntegrationConfig(BaseModel):
+class APIIntegrationConfig(_ConfigModel):
     """Single API integration settings."""
     enabled: bool = False
     api_key: Optional[str] = None
     provider: str
 
 
-class KnowledgeConfig(BaseModel):
+class KnowledgeConfig(_ConfigModel):
     """Knowledge graph configuration."""
     enabled: bool = True
     use_wikipedia: bool = True
     use_wikidata: bool = False
 
 
-class APIsConfig(BaseModel):
+class APIsConfig(_ConfigModel):
     """External API configurations."""
     weather: APIIntegrationConfig = Field(
         default_factory=lambda: APIIntegrationConfig(enabled=True, provider="openweathermap")
@@ -198,16 +212,16 @@ class APIsConfig(BaseModel):
     knowledge: KnowledgeConfig = Field(default_factory=KnowledgeConfig)
 
 
-class SafetyConfig(BaseModel):
+class SafetyConfig(_ConfigModel):
     """Safety and security settings."""
     require_confirmation_for_high_risk: bool = True
     high_risk_cooldown_seconds: int = 5
     sandbox_code_execution: bool = True
     max_code_execution_time: int = 10
-    command_whitelist: List[str] = Field(default_factory=list)
+    command_whitelist: Tuple[str, ...] = ()
 
 
-class Config(BaseModel):
+class Config(_ConfigModel):
     """Main configuration class."""
     assistant: AssistantConfig = Field(default_factory=AssistantConfig)
     models: ModelsConfig = Field(default_factory=ModelsConfig)
@@ -222,12 +236,13 @@ class Config(BaseModel):
     apis: APIsConfig = Field(default_factory=APIsConfig)
     safety: SafetyConfig = Field(default_factory=SafetyConfig)
 
-    class Config:
-        """Pydantic configuration."""
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 
+_DEFAULT_CONFIG_PATH = Path("config/default.yaml")
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration from YAML file with environment variable overrides.
@@ -238,27 +253,110 @@ def load_config(config_path: Optional[str] = None) -> Config:
     Returns:
         Config object with loaded settings
     """
+    from dotenv import load_dotenv
+    
     # Load environment variables from .env file if present
     load_dotenv()
     
     # Determine config file path
     if config_path is None:
-        config_path = os.getenv("ASSISTANT_CONFIG_PATH", "config/default.yaml")
+        config_path = os.getenv("ASSISTANT_CONFIG_PATH")
     
-    config_file = Path(config_path)
+    config_file = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
     
-    # Load YAML configuration
-    if config_file.exists():
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f) or {}
-    else:
-        config_dict = {}
+    data = config_file.read_bytes() if config_file.exists() else None
+    
+    # Same file contents and overrides as the last load: reuse that
+    # (frozen) Config instead of parsing and validating again
+    global _last_load
+    digest = _config_digest(config_file, data)
+    last_load = _last_load
+    if last_load is not None and last_load[0] == digest:
+        return last_load[1]
+    
+    # Load YAML (or TOML) configuration
+    config_dict = _parse_config_data(config_file, data) if data is not None else {}
     
     # Apply environment variable overrides
     config_dict = _apply_env_overrides(config_dict)
     
-    # Create and validate config object
-    return Config(**config_dict)
+    # Pure defaults are trusted; skip validating the whole tree
+    if not config_dict:
+        config = Config.model_construct()
+    else:
+        # Create and validate config object in one pass of pydantic-core
+        config = Config.model_validate(config_dict)
+    
+    _last_load = (digest, config)
+    return config
+
+
+# (digest of inputs, Config) from the most recent load_config call
+_last_load: Optional[Tuple[bytes, Config]] = None
+
+
+def _config_digest(config_file: Path, data: Optional[bytes]) -> bytes:
+    """
+    Hash everything a load depends on: file path, contents and overrides.
+    
+    Args:
+        config_file: Configuration file path
+        data: File contents, or None if the file does not exist
+        
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(config_file).encode("utf-8", "surrogateescape"))
+    digest.update(b"\0" if data is None else b"\1" + data)
+    for key, value in _get_assistant_env():
+        digest.update(f"\0{key}={value}".encode("utf-8", "surrogateescape"))
+    return digest.digest()
+
+
+def _parse_config_data(config_file: Path, data: bytes) -> Dict[str, Any]:
+    """
+    Parse configuration file contents; .toml files use tomllib, others YAML.
+    
+    Args:
+        config_file: Configuration file path (its suffix selects the parser)
+        data: Raw file contents
+        
+    Returns:
+        Parsed configuration dictionary
+    """
+    if config_file.suffix == ".toml":
+        if tomllib is None:
+            raise ImportError("TOML configuration files require Python 3.11+")
+        return tomllib.loads(data.decode("utf-8"))
+    
+    import yaml
+    
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader) or {}
+
+
+_ENV_PREFIX = "ASSISTANT_"
+
+# Cached ASSISTANT_* (key, value) pairs; built on first load, after .env is read
+_assistant_env: Optional[List[Tuple[str, str]]] = None
+
+
+def _get_assistant_env() -> List[Tuple[str, str]]:
+    """
+    Get ASSISTANT_* environment variables, scanning os.environ only once.
+    
+    Returns:
+        List of (name, value) pairs
+    """
+    global _assistant_env
+    if _assistant_env is None:
+        _assistant_env = [
+            (key, value) for key, value in os.environ.items()
+            if key.startswith(_ENV_PREFIX)
+        ]
+    return _assistant_env
 
 
 def _apply_env_overrides(config_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -276,15 +374,21 @@ def _apply_env_overrides(config_dict: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration dictionary with environment overrides applied
     """
-    prefix = "ASSISTANT_"
+    assistant_env = _get_assistant_env()
+    if not assistant_env:
+        return config_dict
     
-    for key, value in os.environ.items():
-        if not key.startswith(prefix):
-            continue
-        
-        # Remove prefix and split by double underscore
-        config_key = key[len(prefix):].lower()
-        parts = config_key.split("__")
+    prefix_len = len(_ENV_PREFIX)
+    
+    for key, value in assistant_env:
+        # Known fields map straight to their path; the raw string is
+        # coerced to the declared field type by validation
+        config_key = key[prefix_len:]
+        parts = _ENV_PATH_INDEX.get(config_key.upper())
+        if parts is None:
+            # Unknown (extra) keys: split by double underscore and guess the type
+            parts = config_key.lower().split("__")
+            value = _parse_env_value(value)
         
         # Navigate to the correct nested dictionary
         current = config_dict
@@ -293,13 +397,47 @@ def _apply_env_overrides(config_dict: Dict[str, Any]) -> Dict[str, Any]:
                 current[part] = {}
             current = current[part]
         
-        # Set the value (try to parse as int/float/bool)
-        final_key = parts[-1]
-        current[final_key] = _parse_env_value(value)
+        current[parts[-1]] = value
     
     return config_dict
 
 
+def _build_env_path_index(
+    model: type,
+    prefix: Tuple[str, ...] = ()
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Map env-style keys (e.g. SERVER__PORT) to field paths of a config model.
+    
+    Args:
+        model: Config model class to walk
+        prefix: Path of the model within the root Config
+        
+    Returns:
+        Dictionary of uppercase double-underscore keys to field paths
+    """
+    index = {}
+    for name, field in model.model_fields.items():
+        path = prefix + (name,)
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            index.update(_build_env_path_index(annotation, path))
+        else:
+            index["__".join(path).upper()] = path
+    return index
+
+
+_ENV_PATH_INDEX = _build_env_path_index(Config)
+
+
+_BOOL_VALUES = {
+    "true": True, "yes": True, "1": True,
+    "false": False, "no": False, "0": False
+}
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+
+
 def _parse_env_value(value: str) -> Any:
     """
     Parse environment variable value to appropriate type.
@@ -311,22 +449,15 @@ def _parse_env_value(value: str) -> Any:
         Parsed value (int, float, bool, or str)
     """
     # Try boolean
-    if value.lower() in ("true", "yes", "1"):
-        return True
-    if value.lower() in ("false", "no", "0"):
-        return False
+    flag = _BOOL_VALUES.get(value.lower())
+    if flag is not None:
+        return flag
     
-    # Try integer
-    try:
+    # Try integer, then float, without raising on plain strings
+    if _INT_RE.fullmatch(value):
         return int(value)
-    except ValueError:
-        pass
-    
-    # Try float
-    try:
+    if _FLOAT_RE.fullmatch(value):
         return float(value)
-    except ValueError:
-        pass
     
     # Return as string
     return value
@@ -334,6 +465,7 @@ def _parse_env_value(value: str) -> Any:
 
 # Global config instance
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
@@ -344,21 +476,32 @@ def get_config() -> Config:
         Global Config object
     """
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    config = _config
+    if config is not None:
+        return config
+    
+    # First use: only one thread loads; the rest reuse its result
+    with _config_lock:
+        if _config is None:
+            _config = load_config()
+        return _config
 
 
-def reload_config(config_path: Optional[str] = None) -> Config:
+def reload_config(config_path: Optional[str] = None, refresh_env: bool = True) -> Config:
     """
     Reload configuration from file.
     
     Args:
         config_path: Path to configuration file
+        refresh_env: Rescan ASSISTANT_* environment variables
         
     Returns:
         Reloaded Config object
     """
-    global _config
-    _config = load_config(config_path)
-    return _config
+    global _config, _assistant_env
+    with _config_lock:
+        if refresh_env:
+            # Rescanned by load_config once .env has been read
+            _assistant_env = None
+        _config = load_config(config_path)
+        return _config
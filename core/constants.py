@@ -3,11 +3,23 @@ Constants and configuration values for Jarvis AI system.
 Centralizes magic numbers and thresholds for better maintainability.
 """
 
+import re
 from enum import Enum
+from types import MappingProxyType
 from typing import Dict, Any
 
 
-class ResponseLimits:
+class _FrozenNamespace(type):
+    """Metaclass for constant namespaces: attributes are read-only after definition"""
+    
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"{cls.__name__}.{name} is a constant")
+    
+    def __delattr__(cls, name):
+        raise AttributeError(f"{cls.__name__}.{name} is a constant")
+
+
+class ResponseLimits(metaclass=_FrozenNamespace):
     """Response formatting and content limits"""
     MAX_CONTENT_LENGTH = 1500
     MAX_SEARCH_RESULTS = 3
@@ -19,7 +31,7 @@ class ResponseLimits:
     MIN_QUERY_LENGTH = 1
 
 
-class ConfidenceThresholds:
+class ConfidenceThresholds(metaclass=_FrozenNamespace):
     """Confidence thresholds for decision making"""
     CLARIFICATION_NEEDED = 0.4
     LOW_CONFIDENCE = 0.5
@@ -33,7 +45,7 @@ class ConfidenceThresholds:
     WEB_SEARCH_THRESHOLD = 0.6
 
 
-class CacheSettings:
+class CacheSettings(metaclass=_FrozenNamespace):
     """Cache configuration"""
     DEFAULT_TTL = 3600  # 1 hour
     WEB_SEARCH_TTL = 1800  # 30 minutes
@@ -55,7 +67,7 @@ class ModelSettings:
     EMBEDDING_DIMENSION = 384
 
 
-class APISettings:
+class APISettings(metaclass=_FrozenNamespace):
     """API configuration and limits"""
     REQUEST_TIMEOUT = 10.0
     MAX_RETRIES = 3
@@ -85,8 +97,8 @@ class ResponseFormats:
     SECTION_SEPARATOR = "-" * 80
     SUBSECTION_SEPARATOR = "─" * 80
     
-    # Emoji mappings
-    EMOJIS = {
+    # Emoji mappings (read-only)
+    EMOJIS = MappingProxyType({
         'search': '🔍',
         'finance': '💰',
         'railway': '🚂',
@@ -100,7 +112,7 @@ class ResponseFormats:
         'magic': '✨',
         'brain': '🧠',
         'robot': '🤖'
-    }
+    })
 
 
 class PersonalitySettings:
@@ -117,7 +129,7 @@ class PersonalitySettings:
     }
 
 
-class MemorySettings:
+class MemorySettings(metaclass=_FrozenNamespace):
     """Memory and learning configuration"""
     MAX_CONVERSATION_HISTORY = 50
     MAX_CONTEXT_TURNS = 3
@@ -151,10 +163,27 @@ class LoggingSettings:
         r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Emails
         r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # Phone numbers
     ]
+    
+    # All patterns as one alternation, so text is scanned once
+    SENSITIVE_REGEX = re.compile("|".join(f"(?:{p})" for p in SENSITIVE_PATTERNS))
+
+
+def redact(text: str, replacement: str = "[REDACTED]") -> str:
+    """
+    Replace sensitive data (cards, emails, phone numbers) in text.
+    
+    Args:
+        text: Text to redact
+        replacement: Replacement for each match
+        
+    Returns:
+        Redacted text
+    """
+    return LoggingSettings.SENSITIVE_REGEX.sub(replacement, text)
 
 
 # Feature flags for enabling/disabling functionality
-class FeatureFlags:
+class FeatureFlags(metaclass=_FrozenNamespace):
     """Feature toggles for different capabilities"""
     ENABLE_WEB_SCRAPING = True
     ENABLE_INDIAN_APIS = True
@@ -167,8 +196,8 @@ class FeatureFlags:
     ENABLE_TOPIC_MODELING = True
 
 
-# Default configuration
-DEFAULT_CONFIG = {
+# Default configuration (read-only view)
+DEFAULT_CONFIG = MappingProxyType({
     'response_limits': ResponseLimits,
     'confidence_thresholds': ConfidenceThresholds,
     'cache_settings': CacheSettings,
@@ -178,4 +207,4 @@ DEFAULT_CONFIG = {
     'memory_settings': MemorySettings,
     'logging_settings': LoggingSettings,
     'feature_flags': FeatureFlags
-}
\ No newline at end of file
+})
\ No newline at end of file
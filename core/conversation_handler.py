@@ -3,118 +3,250 @@ Enhanced Conversation Handler for Natural Language Understanding
 Improves Jarvis's ability to understand and respond to normal English
 """
 
+import random
 import re
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from itertools import islice
 from typing import Dict, Any, Optional, List, Tuple
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Optional imports
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Entity extraction patterns
+_RE_NUMBER = re.compile(r'\b\d+\b')
+_TRAIN_NUMBER_LENGTH = 5
+_RE_AMOUNT = re.compile(r'₹?\s*\d+(?:,\d{3})*(?:\.\d{2})?')
+
+# Query type vocabularies, matched against whole words
+_RE_WORD = re.compile(r'\w+')
+_QUESTION_STARTS = frozenset({'what', 'when', 'where', 'who', 'why', 'how'})
+_COMMAND_STARTS = frozenset({'show', 'tell', 'give', 'find', 'search', 'get'})
+_STATEMENT_WORDS = frozenset({'is', 'are', 'was', 'were', 'will', 'would'})
+
+# Common Indian cities recognised as locations, in reporting order
+_INDIAN_CITIES = ('delhi', 'mumbai', 'bangalore', 'chennai', 'kolkata', 'hyderabad',
+                  'pune', 'ahmedabad', 'jaipur', 'lucknow', 'muzaffarnagar')
+
+
+# Anchored prefix checks for improve_response (prefix semantics, no word boundary)
+_RE_QUESTION_START = re.compile(r'wh(?:at|en|ere|o|y)|how')
+_RE_DIRECT_ANSWER = re.compile(r'The|It|This|That|Here')
+_RE_POLITE = re.compile(r'please|thank|hope', re.IGNORECASE)
+
+# Ambiguity vocabularies for clarification, matched against whole words
+_AMBIGUOUS_TERMS = {
+    'help': ('technical help', 'information', 'tutorial', 'support'),
+    'show': ('display information', 'search for', 'demonstrate'),
+    'find': ('search web', 'locate information', 'discover'),
+    'check': ('verify', 'look up', 'examine'),
+    'get': ('retrieve', 'fetch', 'obtain information'),
+}
+_AMBIGUOUS_KEYS = frozenset(_AMBIGUOUS_TERMS)
+_VAGUE_WORDS = frozenset({'something', 'anything', 'stuff', 'things', 'that', 'this', 'it'})
+
+# Clarification replies: option numbers and yes/no vocabularies
+_OPTION_INDEXES = {str(number): number - 1 for number in range(1, 6)}
+_AFFIRMATIVE_WORDS = frozenset({'yes', 'yeah', 'correct', 'right', 'exactly'})
+_NEGATIVE_WORDS = frozenset({'no', 'nope', 'wrong', 'different'})
+
+# Suggestion keywords by topic, matched at the start of a word; fund precedes
+# fun so "funds" is not read as entertainment
+_SUGGESTION_REGEX = re.compile(
+    r'\b(?:(?P<finance>price|cost|money|bitcoin|crypto)'
+    r'|(?P<rail>train|railway|travel)'
+    r'|(?P<fund>fund|investment|nav)'
+    r'|(?P<search>search|find|look)'
+    r'|(?P<fun>joke|fun|entertain))'
+)
+_TOPIC_SUGGESTIONS = {
+    'finance': ("Check cryptocurrency prices in INR", "View currency exchange rates"),
+    'rail': ("Check train schedules from Muzaffarnagar", "Get railway information"),
+    'fund': ("Check mutual fund NAV", "Search for specific mutual funds"),
+    'search': ("Search the web for information", "Find specific topics or articles"),
+    'fun': ("Tell you a joke", "Show you a cute dog image", "Share an inspirational quote"),
+}
+
+
+def _build_city_automaton():
+    """Build an Aho-Corasick automaton mapping each city to its list index"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, city in enumerate(_INDIAN_CITIES):
+        automaton.add_word(city, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_CITY_AUTOMATON = _build_city_automaton()
+
+
+# Conversational intent patterns, in priority order
+_INTENT_PATTERNS = {
+    'greeting': (
+        r'\b(hi|hello|hey|greetings|good\s+(morning|afternoon|evening))\b',
+        r'\b(what\'s up|wassup|sup)\b'
+    ),
+    'farewell': (
+        r'\b(bye|goodbye|see you|later|farewell)\b',
+        r'\b(good\s+night|take care)\b'
+    ),
+    'thanks': (
+        r'\b(thank|thanks|thx|appreciate)\b',
+        r'\b(grateful|gratitude)\b'
+    ),
+    'how_are_you': (
+        r'\bhow\s+(are|r)\s+you\b',
+        r'\bhow\'s\s+it\s+going\b',
+        r'\bhow\s+are\s+things\b'
+    ),
+    'what_can_you_do': (
+        r'\bwhat\s+can\s+you\s+do\b',
+        r'\bwhat\s+are\s+you\s+capable\s+of\b',
+        r'\bwhat\s+are\s+your\s+(abilities|features|capabilities)\b',
+        r'\bhelp\s+me\b'
+    ),
+    'who_are_you': (
+        r'\bwho\s+are\s+you\b',
+        r'\bwhat\s+are\s+you\b',
+        r'\btell\s+me\s+about\s+yourself\b'
+    ),
+    'affirmative': (
+        r'\b(yes|yeah|yep|sure|okay|ok|alright|correct|right)\b',
+    ),
+    'negative': (
+        r'\b(no|nope|nah|not\s+really|don\'t\s+think\s+so)\b',
+    )
+}
+_COMPILED_INTENT_PATTERNS = {
+    intent: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for intent, patterns in _INTENT_PATTERNS.items()
+}
+# One alternation over every intent; the named group that matched gives a
+# candidate intent in a single scan of the query
+_INTENT_REGEX = re.compile(
+    '|'.join(
+        f"(?P<{intent}>{'|'.join(patterns)})"
+        for intent, patterns in _INTENT_PATTERNS.items()
+    ),
+    re.IGNORECASE
+)
+_INTENT_NAMES = tuple(_INTENT_PATTERNS)
+_INTENT_RANK = {intent: i for i, intent in enumerate(_INTENT_NAMES)}
+
+# Response templates per conversational intent
+_RESPONSES = {
+    'greeting': (
+        "Hello! I'm Jarvis, your personal AI assistant. How may I help you today?",
+        "Good day! Jarvis at your service. What can I do for you?",
+        "Greetings! I'm here to assist you with anything you need."
+    ),
+    'farewell': (
+        "Goodbye! Feel free to return anytime you need assistance.",
+        "Until next time! I'm always here when you need me.",
+        "Take care! Don't hesitate to ask if you need anything."
+    ),
+    'thanks': (
+        "You're very welcome! I'm happy to help.",
+        "My pleasure! That's what I'm here for.",
+        "Glad I could assist you! Let me know if you need anything else."
+    ),
+    'how_are_you': (
+        "I'm functioning optimally, thank you for asking! How can I assist you today?",
+        "All systems operational! I'm ready to help you with whatever you need.",
+        "I'm doing well, thank you! What can I do for you?"
+    ),
+    'what_can_you_do': (
+        "I can help you with many things! I can:\n"
+        "• Search the web and provide detailed information\n"
+        "• Check Bitcoin prices and currency rates in INR\n"
+        "• Provide Indian Railway train schedules\n"
+        "• Show mutual fund NAV information\n"
+        "• Tell jokes and show cute animal pictures\n"
+        "• Give inspirational quotes\n"
+        "• Answer questions and have conversations\n"
+        "• Perform calculations\n"
+        "• And much more! Just ask me anything.",
+
+        "I'm your personal AI assistant with many capabilities:\n"
+        "📊 Financial data (crypto, currency rates, mutual funds)\n"
+        "🚂 Indian Railway information\n"
+        "🔍 Web search and information retrieval\n"
+        "😄 Entertainment (jokes, images, quotes)\n"
+        "📍 Location and geographical data\n"
+        "💬 Natural conversations\n"
+        "What would you like help with?"
+    ),
+    'who_are_you': (
+        "I'm Jarvis, an advanced AI assistant created to help you with various tasks. "
+        "I can search the web, provide financial information, help with Indian Railway schedules, "
+        "entertain you with jokes and quotes, and much more. Think of me as your personal digital assistant!",
+
+        "I'm Jarvis - your intelligent AI companion. I'm designed to understand natural language "
+        "and assist you with information, entertainment, and various tasks. I specialize in "
+        "Indian-specific services like railway information and INR financial data, but I can help "
+        "with many other things too!"
+    )
+}
+
+
+class _QueryView:
+    """Lowercased and tokenized forms of one query, computed once per turn"""
+    
+    __slots__ = ('text', 'lower', 'tokens', 'words', 'word_set')
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.tokens = tuple(self.lower.split())  # Whitespace tokens, for length checks
+        self.words = tuple(_RE_WORD.findall(self.lower))  # Word runs, for vocabulary checks
+        self.word_set = frozenset(self.words)
+
+
+def _tail(items: deque, count: int) -> List[Any]:
+    """Return the last ``count`` items of a deque without copying the rest"""
+    return list(islice(items, max(0, len(items) - count), None))
+
 
 class ConversationHandler:
     """Handles natural language understanding and contextual responses"""
     
     def __init__(self):
-        self.conversation_history = []  # Full conversation history
-        self.conversation_context = []  # Recent context (last 10)
+        self.max_history = 50  # Keep last 50 exchanges
+        # Full conversation history, stored as parallel columns
+        self._hist_queries: deque = deque(maxlen=self.max_history)
+        self._hist_responses: deque = deque(maxlen=self.max_history)
+        self._hist_intents: deque = deque(maxlen=self.max_history)
+        self._hist_timestamps: deque = deque(maxlen=self.max_history)
+        self.conversation_context: deque = deque(maxlen=10)  # Recent context (last 10)
         self.last_topic = None
         self.last_query = None
         self.last_response = None
         self.awaiting_clarification = False
         self.clarification_options = []
-        self.max_history = 50  # Keep last 50 exchanges
         
-        # Common conversational patterns
-        self.patterns = {
-            'greeting': [
-                r'\b(hi|hello|hey|greetings|good\s+(morning|afternoon|evening))\b',
-                r'\b(what\'s up|wassup|sup)\b'
-            ],
-            'farewell': [
-                r'\b(bye|goodbye|see you|later|farewell)\b',
-                r'\b(good\s+night|take care)\b'
-            ],
-            'thanks': [
-                r'\b(thank|thanks|thx|appreciate)\b',
-                r'\b(grateful|gratitude)\b'
-            ],
-            'how_are_you': [
-                r'\bhow\s+(are|r)\s+you\b',
-                r'\bhow\'s\s+it\s+going\b',
-                r'\bhow\s+are\s+things\b'
-            ],
-            'what_can_you_do': [
-                r'\bwhat\s+can\s+you\s+do\b',
-                r'\bwhat\s+are\s+you\s+capable\s+of\b',
-                r'\bwhat\s+are\s+your\s+(abilities|features|capabilities)\b',
-                r'\bhelp\s+me\b'
-            ],
-            'who_are_you': [
-                r'\bwho\s+are\s+you\b',
-                r'\bwhat\s+are\s+you\b',
-                r'\btell\s+me\s+about\s+yourself\b'
-            ],
-            'affirmative': [
-                r'\b(yes|yeah|yep|sure|okay|ok|alright|correct|right)\b'
-            ],
-            'negative': [
-                r'\b(no|nope|nah|not\s+really|don\'t\s+think\s+so)\b'
-            ]
-        }
+        # LRU caches for the pure text-analysis helpers, keyed by query text
+        self.cache_size = 128
+        self._intent_cache: OrderedDict = OrderedDict()
+        self._query_type_cache: OrderedDict = OrderedDict()
+        self._entity_cache: OrderedDict = OrderedDict()
+        self._last_view: Optional[_QueryView] = None
         
-        # Response templates
-        self.responses = {
-            'greeting': [
-                "Hello! I'm Jarvis, your personal AI assistant. How may I help you today?",
-                "Good day! Jarvis at your service. What can I do for you?",
-                "Greetings! I'm here to assist you with anything you need."
-            ],
-            'farewell': [
-                "Goodbye! Feel free to return anytime you need assistance.",
-                "Until next time! I'm always here when you need me.",
-                "Take care! Don't hesitate to ask if you need anything."
-            ],
-            'thanks': [
-                "You're very welcome! I'm happy to help.",
-                "My pleasure! That's what I'm here for.",
-                "Glad I could assist you! Let me know if you need anything else."
-            ],
-            'how_are_you': [
-                "I'm functioning optimally, thank you for asking! How can I assist you today?",
-                "All systems operational! I'm ready to help you with whatever you need.",
-                "I'm doing well, thank you! What can I do for you?"
-            ],
-            'what_can_you_do': [
-                "I can help you with many things! I can:\n"
-                "• Search the web and provide detailed information\n"
-                "• Check Bitcoin prices and currency rates in INR\n"
-                "• Provide Indian Railway train schedules\n"
-                "• Show mutual fund NAV information\n"
-                "• Tell jokes and show cute animal pictures\n"
-                "• Give inspirational quotes\n"
-                "• Answer questions and have conversations\n"
-                "• Perform calculations\n"
-                "• And much more! Just ask me anything.",
-                
-                "I'm your personal AI assistant with many capabilities:\n"
-                "📊 Financial data (crypto, currency rates, mutual funds)\n"
-                "🚂 Indian Railway information\n"
-                "🔍 Web search and information retrieval\n"
-                "😄 Entertainment (jokes, images, quotes)\n"
-                "📍 Location and geographical data\n"
-                "💬 Natural conversations\n"
-                "What would you like help with?"
-            ],
-            'who_are_you': [
-                "I'm Jarvis, an advanced AI assistant created to help you with various tasks. "
-                "I can search the web, provide financial information, help with Indian Railway schedules, "
-                "entertain you with jokes and quotes, and much more. Think of me as your personal digital assistant!",
-                
-                "I'm Jarvis - your intelligent AI companion. I'm designed to understand natural language "
-                "and assist you with information, entertainment, and various tasks. I specialize in "
-                "Indian-specific services like railway information and INR financial data, but I can help "
-                "with many other things too!"
-            ]
-        }
+        # Common conversational patterns (compiled once at import)
+        self.patterns = _COMPILED_INTENT_PATTERNS
+        
+        # Response templates (shared, never mutated)
+        self.responses = _RESPONSES
     
     def detect_intent(self, query: str) -> Tuple[Optional[str], float]:
         """
@@ -123,29 +255,51 @@ class ConversationHandler:
         Returns:
             Tuple of (intent_name, confidence_score)
         """
-        query_lower = query.lower().strip()
-        
-        for intent, patterns in self.patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower, re.IGNORECASE):
-                    # Calculate confidence based on pattern match
-                    confidence = 0.9 if len(query_lower.split()) <= 5 else 0.7
-                    return intent, confidence
-        
-        return None, 0.0
+        view = self._view(query)
+        query_lower = view.lower.strip()
+        cached = self._cache_get(self._intent_cache, query_lower)
+        if cached is None:
+            cached = self._cache_put(self._intent_cache, query_lower,
+                                     self._match_intent(query_lower, len(view.tokens)))
+        return cached
+    
+    def _match_intent(self, query_lower: str, word_count: int) -> Tuple[Optional[str], float]:
+        """Run the intent patterns against a normalized query"""
+        match = _INTENT_REGEX.search(query_lower)
+        if not match:
+            return None, 0.0
+        
+        # The fused regex picks the leftmost match; intents declared earlier
+        # still take priority, so only those need an individual check
+        intent = match.lastgroup
+        for earlier in _INTENT_NAMES[:_INTENT_RANK[intent]]:
+            if any(pattern.search(query_lower) for pattern in self.patterns[earlier]):
+                intent = earlier
+                break
+        
+        # Calculate confidence based on pattern match
+        confidence = 0.9 if word_count <= 5 else 0.7
+        return intent, confidence
     
     def get_response(self, intent: str) -> str:
         """Get a response for a detected intent"""
-        import random
-        
-        if intent in self.responses:
-            responses = self.responses[intent]
+        responses = self.responses.get(intent)
+        if responses:
             return random.choice(responses)
         
         return None
     
     def extract_entities(self, query: str) -> Dict[str, Any]:
         """Extract entities from the query"""
+        cached = self._cache_get(self._entity_cache, query)
+        if cached is None:
+            cached = self._cache_put(self._entity_cache, query, self._extract_entities(self._view(query)))
+        # Hand out fresh lists so callers cannot mutate the cached result
+        return {key: list(values) for key, values in cached.items()}
+    
+    def _extract_entities(self, view: _QueryView) -> Dict[str, Any]:
+        """Run the entity extractors over a query"""
+        query = view.text
         entities = {
             'numbers': [],
             'dates': [],
@@ -155,23 +309,24 @@ class ConversationHandler:
         }
         
         # Extract numbers
-        numbers = re.findall(r'\b\d+\b', query)
+        numbers = _RE_NUMBER.findall(query)
         entities['numbers'] = numbers
         
-        # Extract train numbers (5 digits)
-        train_numbers = re.findall(r'\b\d{5}\b', query)
+        # Extract train numbers (standalone 5-digit numbers)
+        train_numbers = [number for number in numbers if len(number) == _TRAIN_NUMBER_LENGTH]
         entities['train_numbers'] = train_numbers
         
         # Extract amounts with currency
-        amounts = re.findall(r'₹?\s*\d+(?:,\d{3})*(?:\.\d{2})?', query)
+        amounts = _RE_AMOUNT.findall(query)
         entities['amounts'] = amounts
         
         # Extract common Indian cities
-        indian_cities = ['delhi', 'mumbai', 'bangalore', 'chennai', 'kolkata', 'hyderabad', 
-                        'pune', 'ahmedabad', 'jaipur', 'lucknow', 'muzaffarnagar']
-        for city in indian_cities:
-            if city in query.lower():
-                entities['locations'].append(city.title())
+        query_lower = view.lower
+        if _CITY_AUTOMATON is not None:
+            found = sorted({index for _, index in _CITY_AUTOMATON.iter(query_lower)})
+            entities['locations'] = [_INDIAN_CITIES[index].title() for index in found]
+        else:
+            entities['locations'] = [city.title() for city in _INDIAN_CITIES if city in query_lower]
         
         return entities
     
@@ -198,22 +353,64 @@ class ConversationHandler:
     
     def _determine_query_type(self, query: str) -> str:
         """Determine the type of query"""
-        query_lower = query.lower()
+        view = self._view(query)
+        cached = self._cache_get(self._query_type_cache, view.lower)
+        if cached is None:
+            cached = self._cache_put(self._query_type_cache, view.lower,
+                                     self._classify_query_type(view))
+        return cached
+    
+    @staticmethod
+    def _classify_query_type(view: _QueryView) -> str:
+        """Classify a query as question, command, statement or general"""
+        tokens = view.words
+        if not tokens:
+            return 'general'
         
         # Question types
-        if query_lower.startswith(('what', 'when', 'where', 'who', 'why', 'how')):
+        first = tokens[0]
+        if first in _QUESTION_STARTS:
             return 'question'
         
         # Command types
-        if query_lower.startswith(('show', 'tell', 'give', 'find', 'search', 'get')):
+        if first in _COMMAND_STARTS:
             return 'command'
         
         # Statement types
-        if any(word in query_lower for word in ['is', 'are', 'was', 'were', 'will', 'would']):
+        if not _STATEMENT_WORDS.isdisjoint(view.word_set):
             return 'statement'
         
         return 'general'
     
+    def _view(self, query: str) -> _QueryView:
+        """Return the analysis view for a query, reusing the last one built"""
+        view = self._last_view
+        if view is None or view.text != query:
+            view = self._last_view = _QueryView(query)
+        return view
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str) -> Any:
+        """Return a cached value and mark it recently used, or None on a miss"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any) -> Any:
+        """Store a value, evicting the least recently used entry when full"""
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
+    
+    def _clear_caches(self):
+        """Drop all cached query analysis results"""
+        self._intent_cache.clear()
+        self._query_type_cache.clear()
+        self._entity_cache.clear()
+        self._last_view = None
+    
     def generate_contextual_response(self, query: str, understanding: Dict[str, Any]) -> Optional[str]:
         """Generate a contextual response based on understanding"""
         intent = understanding.get('intent')
@@ -234,11 +431,11 @@ class ConversationHandler:
     def improve_response(self, response: str, query: str) -> str:
         """Improve a response to make it more natural and conversational"""
         # Add conversational elements
-        query_lower = query.lower()
+        query_lower = self._view(query).lower
         
         # If it's a question, make sure response is informative
-        if query_lower.startswith(('what', 'how', 'why', 'when', 'where', 'who')):
-            if not any(response.startswith(word) for word in ['The', 'It', 'This', 'That', 'Here']):
+        if _RE_QUESTION_START.match(query_lower):
+            if not _RE_DIRECT_ANSWER.match(response):
                 # Add context
                 if 'what' in query_lower:
                     response = f"Regarding your question: {response}"
@@ -246,56 +443,44 @@ class ConversationHandler:
                     response = f"Here's how: {response}"
         
         # Add politeness
-        if len(response) > 100 and not any(word in response.lower() for word in ['please', 'thank', 'hope']):
+        if len(response) > 100 and not _RE_POLITE.search(response):
             response += " I hope this helps!"
         
         return response
     
-    def get_conversation_summary(self) -> str:
-        """Get a summary of recent conversation"""
-        if not self.conversation_context:
-            return "No recent conversation."
-        
-        recent = self.conversation_context[-3:]
-        summary = "Recent conversation:\n"
-        for item in recent:
-            summary += f"- You asked: {item['query'][:50]}...\n"
-        
-        return summary
-
-
     def add_to_history(self, query: str, response: str, intent: Optional[str] = None):
         """Add exchange to conversation history"""
-        exchange = {
-            'query': query,
-            'response': response,
-            'intent': intent,
-            'timestamp': __import__('datetime').datetime.now().isoformat()
-        }
-        
-        self.conversation_history.append(exchange)
+        self._hist_queries.append(query)
+        self._hist_responses.append(response)
+        self._hist_intents.append(intent)
+        self._hist_timestamps.append(time.time())  # Formatted on read
         self.last_query = query
         self.last_response = response
-        
-        # Keep only recent history
-        if len(self.conversation_history) > self.max_history:
-            self.conversation_history = self.conversation_history[-self.max_history:]
     
     def get_conversation_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversation history"""
-        return self.conversation_history[-limit:]
+        columns = zip(self._hist_queries, self._hist_responses, self._hist_intents, self._hist_timestamps)
+        return [
+            {'query': query, 'response': response, 'intent': intent,
+             'timestamp': datetime.fromtimestamp(timestamp).isoformat()}
+            for query, response, intent, timestamp in list(columns)[-limit:]
+        ]
+    
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        """Full conversation history as exchange dicts, built on access"""
+        return self.get_conversation_history(self.max_history)
     
     def get_context_for_query(self, query: str) -> str:
         """Build context string from conversation history"""
-        if not self.conversation_history:
+        if not self._hist_queries:
             return ""
         
-        recent = self.conversation_history[-5:]
         context_parts = ["Recent conversation context:"]
         
-        for exchange in recent:
-            context_parts.append(f"User: {exchange['query']}")
-            context_parts.append(f"Jarvis: {exchange['response'][:100]}...")
+        for past_query, past_response in zip(_tail(self._hist_queries, 5), _tail(self._hist_responses, 5)):
+            context_parts.append(f"User: {past_query}")
+            context_parts.append(f"Jarvis: {past_response[:100]}...")
         
         return "\n".join(context_parts)
     
@@ -306,25 +491,19 @@ class ConversationHandler:
         Returns:
             Tuple of (is_ambiguous, possible_interpretations)
         """
-        query_lower = query.lower()
+        view = self._view(query)
+        words = view.word_set
+        word_count = len(view.tokens)
         possible_meanings = []
         
         # Check for ambiguous terms
-        ambiguous_terms = {
-            'help': ['technical help', 'information', 'tutorial', 'support'],
-            'show': ['display information', 'search for', 'demonstrate'],
-            'find': ['search web', 'locate information', 'discover'],
-            'check': ['verify', 'look up', 'examine'],
-            'get': ['retrieve', 'fetch', 'obtain information']
-        }
-        
-        for term, meanings in ambiguous_terms.items():
-            if term in query_lower and len(query.split()) <= 3:
-                possible_meanings.extend(meanings)
+        if word_count <= 3 and not _AMBIGUOUS_KEYS.isdisjoint(words):
+            for term, meanings in _AMBIGUOUS_TERMS.items():
+                if term in words:
+                    possible_meanings.extend(meanings)
         
         # Check if query is too vague
-        vague_queries = ['something', 'anything', 'stuff', 'things', 'that', 'this', 'it']
-        if any(vague in query_lower for vague in vague_queries) and len(query.split()) <= 4:
+        if word_count <= 4 and not _VAGUE_WORDS.isdisjoint(words):
             return True, ['Please be more specific about what you need']
         
         # Check confidence
@@ -332,7 +511,7 @@ class ConversationHandler:
             return True, ['I need more information to help you']
         
         # If no clear intent and query is short
-        if not understanding.get('intent') and len(query.split()) <= 3:
+        if not understanding.get('intent') and word_count <= 3:
             return True, ['Could you provide more details?']
         
         return len(possible_meanings) > 0, possible_meanings
@@ -354,30 +533,14 @@ class ConversationHandler:
     
     def generate_suggestions(self, query: str) -> List[str]:
         """Generate helpful suggestions based on query"""
-        query_lower = query.lower()
-        suggestions = []
+        topics = {match.lastgroup for match in _SUGGESTION_REGEX.finditer(self._view(query).lower)}
         
         # Based on keywords, suggest relevant features
-        if any(word in query_lower for word in ['price', 'cost', 'money', 'bitcoin', 'crypto']):
-            suggestions.append("Check cryptocurrency prices in INR")
-            suggestions.append("View currency exchange rates")
-        
-        if any(word in query_lower for word in ['train', 'railway', 'travel']):
-            suggestions.append("Check train schedules from Muzaffarnagar")
-            suggestions.append("Get railway information")
-        
-        if any(word in query_lower for word in ['fund', 'investment', 'nav']):
-            suggestions.append("Check mutual fund NAV")
-            suggestions.append("Search for specific mutual funds")
-        
-        if any(word in query_lower for word in ['search', 'find', 'look']):
-            suggestions.append("Search the web for information")
-            suggestions.append("Find specific topics or articles")
-        
-        if any(word in query_lower for word in ['joke', 'fun', 'entertain']):
-            suggestions.append("Tell you a joke")
-            suggestions.append("Show you a cute dog image")
-            suggestions.append("Share an inspirational quote")
+        suggestions = [
+            suggestion
+            for topic, topic_suggestions in _TOPIC_SUGGESTIONS.items() if topic in topics
+            for suggestion in topic_suggestions
+        ]
         
         # If no specific suggestions, provide general ones
         if not suggestions:
@@ -397,39 +560,41 @@ class ConversationHandler:
         if self.awaiting_clarification:
             return False
         
-        # Check for ambiguity
-        is_ambiguous, _ = self.detect_ambiguity(query, understanding)
-        
+        # Cheapest checks first; the ambiguity scan only runs if both pass
         # Check confidence
-        low_confidence = understanding.get('confidence', 1.0) < 0.4
+        if understanding.get('confidence', 1.0) < 0.4:
+            return True
         
         # Check if query is too short and vague
-        too_vague = len(query.split()) <= 2 and not understanding.get('intent')
+        if not understanding.get('intent') and len(self._view(query).tokens) <= 2:
+            return True
         
-        return is_ambiguous or low_confidence or too_vague
+        # Check for ambiguity
+        is_ambiguous, _ = self.detect_ambiguity(query, understanding)
+        return is_ambiguous
     
     def handle_clarification_response(self, query: str) -> Optional[str]:
         """Handle user's response to clarification question"""
         if not self.awaiting_clarification:
             return None
         
-        query_lower = query.lower()
+        view = self._view(query)
         
         # Check if user selected an option
-        if query_lower in ['1', '2', '3', '4', '5']:
-            option_index = int(query_lower) - 1
-            if 0 <= option_index < len(self.clarification_options):
+        option_index = _OPTION_INDEXES.get(view.lower.strip())
+        if option_index is not None:
+            if option_index < len(self.clarification_options):
                 selected = self.clarification_options[option_index]
                 self.awaiting_clarification = False
                 self.clarification_options = []
                 return f"Got it! You want: {selected}. Let me help you with that."
         
         # Check for affirmative/negative responses
-        if any(word in query_lower for word in ['yes', 'yeah', 'correct', 'right', 'exactly']):
+        if not _AFFIRMATIVE_WORDS.isdisjoint(view.word_set):
             self.awaiting_clarification = False
             return "Great! Let me proceed with that."
         
-        if any(word in query_lower for word in ['no', 'nope', 'wrong', 'different']):
+        if not _NEGATIVE_WORDS.isdisjoint(view.word_set):
             self.awaiting_clarification = False
             return "I see. Could you please rephrase what you need?"
         
@@ -440,25 +605,28 @@ class ConversationHandler:
     
     def get_conversation_summary(self) -> str:
         """Get a summary of recent conversation"""
-        if not self.conversation_history:
+        if not self._hist_queries:
             return "No recent conversation."
         
-        recent = self.conversation_history[-3:]
         summary = "Recent conversation:\n"
-        for item in recent:
-            summary += f"- You: {item['query'][:50]}...\n"
-            summary += f"- Jarvis: {item['response'][:50]}...\n"
+        for past_query, past_response in zip(_tail(self._hist_queries, 3), _tail(self._hist_responses, 3)):
+            summary += f"- You: {past_query[:50]}...\n"
+            summary += f"- Jarvis: {past_response[:50]}...\n"
         
         return summary
     
     def clear_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
-        self.conversation_context = []
+        self._hist_queries.clear()
+        self._hist_responses.clear()
+        self._hist_intents.clear()
+        self._hist_timestamps.clear()
+        self.conversation_context.clear()
         self.last_query = None
         self.last_response = None
         self.awaiting_clarification = False
         self.clarification_options = []
+        self._clear_caches()
         logger.info("Conversation history cleared")
 
 
@@ -1,7 +1,9 @@
 """Decision engine for intent classification and context management."""
 
-from typing import Dict, Any, List, Optional
-from collections import deque
+import copy
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import replace
 
 from core.models import Intent, IntentCategory, UserInput
 from core.intent_classifier import IntentClassifier
@@ -10,15 +12,39 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pattern-intent names from InputProcessor mapped to intent categories
+_INTENT_CATEGORY_MAP = {
+    'greeting': IntentCategory.CONVERSATIONAL,
+    'farewell': IntentCategory.CONVERSATIONAL,
+    'thanks': IntentCategory.CONVERSATIONAL,
+    'question': IntentCategory.QUESTION,
+    'command': IntentCategory.COMMAND,
+    'math': IntentCategory.MATH,
+    'search': IntentCategory.FETCH,
+    'weather': IntentCategory.QUESTION,
+    'news': IntentCategory.FETCH,
+    'unknown': IntentCategory.CONVERSATIONAL
+}
+
+# Pattern intents that are never ambiguous, even as a single word
+_SOCIAL_INTENTS = frozenset({'greeting', 'farewell', 'thanks'})
+
 
 class DecisionEngine:
     """Core decision engine for classifying intents and managing context."""
     
+    __slots__ = (
+        'classifier', 'context_window', 'clarification_threshold',
+        'input_processor', 'semantic_matcher', 'context_history',
+        '_previous_intents', 'current_context', 'intent_cache_size', '_intent_cache'
+    )
+    
     def __init__(
         self,
         classifier: Optional[IntentClassifier] = None,
         context_window: int = 5,
-        clarification_threshold: float = 0.15
+        clarification_threshold: float = 0.15,
+        intent_cache_size: int = 128
     ):
         """
         Initialize decision engine.
@@ -27,6 +53,7 @@ class DecisionEngine:
             classifier: Intent classifier instance
             context_window: Number of previous interactions to keep in context
             clarification_threshold: Confidence threshold below which to ask for clarification
+            intent_cache_size: Number of classified inputs to remember
         """
         self.classifier = classifier or IntentClassifier()
         self.context_window = context_window
@@ -38,7 +65,13 @@ class DecisionEngine:
         
         # Conversation context
         self.context_history: deque = deque(maxlen=context_window)
+        self._previous_intents: deque = deque(maxlen=context_window)  # Category values, parallel to history
         self.current_context: Dict[str, Any] = {}
+        
+        # Classification is deterministic for a given text, so remember recent
+        # results (invalid/low-signal inputs included) as (intent, processed)
+        self.intent_cache_size = intent_cache_size
+        self._intent_cache: OrderedDict = OrderedDict()
     
     async def classify_intent(self, user_input: UserInput) -> Intent:
         """
@@ -50,16 +83,64 @@ class DecisionEngine:
         Returns:
             Intent object
         """
+        # Synchronous cache probe first; only a miss awaits the classifiers
+        key = user_input.text
+        cached = self._lookup_intent(key)
+        if cached is None:
+            cached = self._store_intent(key, await self._classify_text(key))
+        
+        base, processed = cached
+        if processed is None:
+            return replace(base, parameters={}, context={})
+        
+        # Fresh Intent per call; context depends on conversation history.
+        # Parameters and the preprocessed dict hold nested lists, so both
+        # are deep-copied to keep callers from mutating the cache
+        intent = replace(
+            base, parameters=copy.deepcopy(base.parameters), context=self._build_context()
+        )
+        intent.context['preprocessed'] = copy.deepcopy(processed)
+        
+        # Update context history
+        self._update_context(user_input, intent)
+        
+        logger.info(f"Classified intent: {intent.category.value} (confidence: {intent.confidence:.2f})")
+        
+        return intent
+    
+    def _lookup_intent(self, key: str) -> Optional[Tuple[Intent, Optional[Dict[str, Any]]]]:
+        """Return a cached classification and mark it recently used."""
+        cached = self._intent_cache.get(key)
+        if cached is not None:
+            self._intent_cache.move_to_end(key)
+        return cached
+    
+    def _store_intent(
+        self,
+        key: str,
+        result: Tuple[Intent, Optional[Dict[str, Any]]]
+    ) -> Tuple[Intent, Optional[Dict[str, Any]]]:
+        """Cache a classification, evicting the least recently used entry."""
+        self._intent_cache[key] = result
+        if len(self._intent_cache) > self.intent_cache_size:
+            self._intent_cache.popitem(last=False)
+        return result
+    
+    async def _classify_text(self, text: str) -> Tuple[Intent, Optional[Dict[str, Any]]]:
+        """
+        Classify raw text without touching conversation context.
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Tuple of (intent, preprocessed input), with None for invalid input
+        """
         # Preprocess input
-        processed = self.input_processor.preprocess(user_input.text)
+        processed = self.input_processor.preprocess(text)
         
         if not processed['valid']:
-            return Intent(
-                category=IntentCategory.CONVERSATIONAL,
-                confidence=0.1,
-                parameters={},
-                context={}
-            )
+            return Intent(category=IntentCategory.CONVERSATIONAL, confidence=0.1), None
         
         # Use pattern-based intent if confidence is high
         if processed['confidence'] >= 0.7:
@@ -67,48 +148,22 @@ class DecisionEngine:
             intent = Intent(
                 category=category,
                 confidence=processed['confidence'],
-                parameters=processed['entities'],
-                context={'preprocessed': processed}
+                parameters=processed['entities']
             )
         else:
             # Fallback to ML classifier
             intent = await self.classifier.classify(processed['normalized'])
         
-        # Add context information
-        intent.context = self._build_context()
-        intent.context['preprocessed'] = processed
-        
-        # Update context history
-        self._update_context(user_input, intent)
-        
-        logger.info(f"Classified intent: {intent.category.value} (confidence: {intent.confidence:.2f})")
-        
-        return intent
+        return intent, processed
     
     def _map_intent_to_category(self, intent: str) -> IntentCategory:
         """Map string intent to IntentCategory."""
-        mapping = {
-            'greeting': IntentCategory.CONVERSATIONAL,
-            'farewell': IntentCategory.CONVERSATIONAL,
-            'thanks': IntentCategory.CONVERSATIONAL,
-            'question': IntentCategory.QUESTION,
-            'command': IntentCategory.COMMAND,
-            'math': IntentCategory.MATH,
-            'search': IntentCategory.FETCH,
-            'weather': IntentCategory.QUESTION,
-            'news': IntentCategory.FETCH,
-            'unknown': IntentCategory.CONVERSATIONAL
-        }
-        return mapping.get(intent, IntentCategory.CONVERSATIONAL)
+        return _INTENT_CATEGORY_MAP.get(intent, IntentCategory.CONVERSATIONAL)
     
     def _build_context(self) -> Dict[str, Any]:
         """Build context from conversation history."""
         context = {
-            'previous_intents': [
-                item['intent'].category.value
-                for item in self.context_history
-                if 'intent' in item
-            ],
+            'previous_intents': list(self._previous_intents),
             'conversation_length': len(self.context_history),
             **self.current_context
         }
@@ -123,6 +178,7 @@ class DecisionEngine:
             'intent': intent,
             'timestamp': user_input.timestamp
         })
+        self._previous_intents.append(intent.category.value)
         
         # Store current user input for ambiguity checking
         self.current_context['user_input'] = user_input.text
@@ -181,13 +237,14 @@ class DecisionEngine:
         # If it's a very short input (1-2 words) and not conversational, it might be ambiguous
         if 'user_input' in self.current_context:
             text = self.current_context['user_input']
-            word_count = len(text.split())
+            # At most two pieces are needed to tell one word from several
+            word_count = len(text.split(None, 1))
             
             # Single word inputs that are not greetings/farewells/thanks are ambiguous
             if word_count <= 1:
                 # Check if it's a known conversational pattern
                 preprocessed = intent.context.get('preprocessed', {})
-                if preprocessed.get('intent') in ['greeting', 'farewell', 'thanks']:
+                if preprocessed.get('intent') in _SOCIAL_INTENTS:
                     return False
                 return True
         
@@ -216,7 +273,9 @@ class DecisionEngine:
     def clear_context(self) -> None:
         """Clear conversation context."""
         self.context_history.clear()
+        self._previous_intents.clear()
         self.current_context.clear()
+        self._intent_cache.clear()
         logger.info("Cleared conversation context")
     
     def get_context_summary(self) -> str:
@@ -10,6 +10,28 @@ from core.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _combine_patterns(patterns: Dict[str, re.Pattern]) -> re.Pattern:
+    """
+    Fuse named patterns into one alternation for a single scan.
+    
+    Each pattern becomes a named group, so ``match.lastgroup`` gives its
+    name. At any position the first listed pattern that matches wins.
+    
+    Args:
+        patterns: Entity type to compiled pattern, in priority order
+        
+    Returns:
+        Combined compiled pattern
+    """
+    parts = []
+    for name, pattern in patterns.items():
+        source = pattern.pattern
+        if pattern.flags & re.DOTALL:
+            source = f'(?s:{source})'
+        parts.append(f'(?P<{name}>{source})')
+    return re.compile('|'.join(parts))
+
+
 class EntityExtractor:
     """
     Advanced entity extraction with custom types and confidence scoring.
@@ -26,19 +48,21 @@ class EntityExtractor:
     def __init__(self):
         """Initialize entity extractor."""
         self.custom_patterns = self._initialize_patterns()
+        self._combined_pattern = _combine_patterns(self.custom_patterns)
         self.entity_cache = {}
+        self._action_word_patterns: Dict[str, re.Pattern] = {}
     
-    def _initialize_patterns(self) -> Dict[str, str]:
+    def _initialize_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for custom entity types."""
         return {
-            'EMAIL': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'URL': r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-            'PHONE': r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b',
-            'FILE_PATH': r'(?:[a-zA-Z]:\\|/)?(?:[\w\-]+[/\\])*[\w\-]+\.[\w]+',
-            'IP_ADDRESS': r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b',
-            'TIME': r'\b(?:[01]?[0-9]|2[0-3]):[0-5][0-9](?::[0-5][0-9])?\s*(?:AM|PM|am|pm)?\b',
-            'MONEY': r'\$\s*\d+(?:,\d{3})*(?:\.\d{2})?',
-            'PERCENTAGE': r'\b\d+(?:\.\d+)?%\b',
+            'EMAIL': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+            'URL': re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'),
+            'PHONE': re.compile(r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b'),
+            'FILE_PATH': re.compile(r'(?:[a-zA-Z]:\\|/)?(?:[\w\-]+[/\\])*[\w\-]+\.[\w]+'),
+            'IP_ADDRESS': re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'),
+            'TIME': re.compile(r'\b(?:[01]?[0-9]|2[0-3]):[0-5][0-9](?::[0-5][0-9])?\s*(?:AM|PM|am|pm)?\b'),
+            'MONEY': re.compile(r'\$\s*\d+(?:,\d{3})*(?:\.\d{2})?'),
+            'PERCENTAGE': re.compile(r'\b\d+(?:\.\d+)?%\b'),
         }
     
     def extract_custom_entities(self, text: str) -> List[Entity]:
@@ -51,21 +75,16 @@ class EntityExtractor:
         Returns:
             List of Entity objects
         """
-        entities = []
-        
-        for entity_type, pattern in self.custom_patterns.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                entity = Entity(
-                    text=match.group(),
-                    type=entity_type,
-                    start=match.start(),
-                    end=match.end(),
-                    confidence=0.95  # High confidence for regex matches
-                )
-                entities.append(entity)
-        
-        return entities
+        return [
+            Entity(
+                text=match.group(),
+                type=match.lastgroup,
+                start=match.start(),
+                end=match.end(),
+                confidence=0.95  # High confidence for regex matches
+            )
+            for match in self._combined_pattern.finditer(text)
+        ]
     
     def extract_application_names(self, text: str) -> List[Entity]:
         """
@@ -138,8 +157,7 @@ class EntityExtractor:
         for i, word in enumerate(words):
             if word in action_verbs:
                 # Find position in original text
-                pattern = r'\b' + re.escape(word) + r'\b'
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = self._action_word_pattern(word).search(text)
                 if match:
                     entity = Entity(
                         text=match.group(),
@@ -152,6 +170,14 @@ class EntityExtractor:
         
         return entities
     
+    def _action_word_pattern(self, word: str) -> re.Pattern:
+        """Get the compiled whole-word pattern for an action verb."""
+        pattern = self._action_word_patterns.get(word)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+            self._action_word_patterns[word] = pattern
+        return pattern
+    
     def classify_entity_context(self, entity: Entity, text: str) -> str:
         """
         Classify entity based on surrounding context.
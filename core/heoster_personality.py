@@ -5,7 +5,9 @@ Developed by Codeex AI Company
 
 from typing import Dict, List, Optional
 from datetime import datetime
+from functools import partial
 import random
+import time
 
 
 class HeosterJarvisPersonality:
@@ -40,6 +42,12 @@ class HeosterJarvisPersonality:
         ]
     }
     
+    # Hour of day (0-23) -> greeting period
+    _HOUR_TO_PERIOD = (
+        ('night',) * 5 + ('morning',) * 7 + ('afternoon',) * 5 +
+        ('evening',) * 4 + ('night',) * 3
+    )
+    
     # Professional acknowledgments
     ACKNOWLEDGMENTS = [
         "Understood, sir.",
@@ -78,6 +86,12 @@ class HeosterJarvisPersonality:
         "From what I've gathered, Heoster,",
     ]
     
+    # Pre-bound random pickers for the pools above
+    _pick_acknowledgment = partial(random.choice, ACKNOWLEDGMENTS)
+    _pick_completion = partial(random.choice, COMPLETIONS)
+    _pick_error_message = partial(random.choice, ERROR_MESSAGES)
+    _pick_info_prefix = partial(random.choice, INFO_PREFIXES)
+    
     def __init__(self):
         self.owner = "Heoster"
         self.company = "Codeex AI"
@@ -87,34 +101,24 @@ class HeosterJarvisPersonality:
     
     def get_greeting(self) -> str:
         """Get time-appropriate greeting for Heoster"""
-        hour = datetime.now().hour
-        
-        if 5 <= hour < 12:
-            time_period = 'morning'
-        elif 12 <= hour < 17:
-            time_period = 'afternoon'
-        elif 17 <= hour < 21:
-            time_period = 'evening'
-        else:
-            time_period = 'night'
-        
+        time_period = self._HOUR_TO_PERIOD[time.localtime().tm_hour]
         return random.choice(self.GREETINGS[time_period])
     
     def get_acknowledgment(self) -> str:
         """Get professional acknowledgment"""
-        return random.choice(self.ACKNOWLEDGMENTS)
+        return self._pick_acknowledgment()
     
     def get_completion(self) -> str:
         """Get task completion message"""
-        return random.choice(self.COMPLETIONS)
+        return self._pick_completion()
     
     def get_error_message(self) -> str:
         """Get professional error message"""
-        return random.choice(self.ERROR_MESSAGES)
+        return self._pick_error_message()
     
     def get_info_prefix(self) -> str:
         """Get information delivery prefix"""
-        return random.choice(self.INFO_PREFIXES)
+        return self._pick_info_prefix()
     
     def format_response(self, content: str, response_type: str = 'general') -> str:
         """
@@ -127,6 +131,10 @@ class HeosterJarvisPersonality:
         Returns:
             Formatted response
         """
+        # Fast path: plain responses need no decoration
+        if response_type == 'general':
+            return content
+        
         if response_type == 'greeting':
             return self.get_greeting()
         
@@ -214,16 +222,16 @@ Remember: You are Heoster's personal AI, developed by Codeex AI. You are here to
         if not results:
             return f"I searched for '{query}', Heoster, but found no relevant results. Would you like me to try a different search?"
         
-        response = f"I found {len(results)} results for '{query}', sir:\n\n"
-        
-        for i, result in enumerate(results[:5], 1):
-            response += f"{i}. **{result.get('title', 'No title')}**\n"
-            response += f"   {result.get('snippet', 'No description')}\n"
-            response += f"   Source: {result.get('url', 'N/A')}\n\n"
-        
-        response += "Would you like me to provide more details on any of these, Heoster?"
+        parts = [f"I found {len(results)} results for '{query}', sir:\n\n"]
+        parts.extend(
+            f"{i}. **{result.get('title', 'No title')}**\n"
+            f"   {result.get('snippet', 'No description')}\n"
+            f"   Source: {result.get('url', 'N/A')}\n\n"
+            for i, result in enumerate(results[:5], 1)
+        )
+        parts.append("Would you like me to provide more details on any of these, Heoster?")
         
-        return response
+        return "".join(parts)
     
     def format_scraped_content(self, url: str, content: Dict) -> str:
         """
@@ -239,22 +247,21 @@ Remember: You are Heoster's personal AI, developed by Codeex AI. You are here to
         if 'error' in content:
             return f"I encountered an issue accessing {url}, sir: {content['error']}"
         
-        response = f"Here's what I found at {url}, Heoster:\n\n"
+        parts = [f"Here's what I found at {url}, Heoster:\n\n"]
         
         if content.get('title'):
-            response += f"**{content['title']}**\n\n"
+            parts.append(f"**{content['title']}**\n\n")
         
         if content.get('description'):
-            response += f"{content['description']}\n\n"
+            parts.append(f"{content['description']}\n\n")
         
         if content.get('content'):
             # Provide summary of content
-            content_text = content['content'][:500]
-            response += f"Summary: {content_text}...\n\n"
+            parts.append(f"Summary: {content['content'][:500]}...\n\n")
         
-        response += "Would you like me to extract specific information from this page, sir?"
+        parts.append("Would you like me to extract specific information from this page, sir?")
         
-        return response
+        return "".join(parts)
     
     def get_status_report(self) -> str:
         """Get Jarvis status report for Heoster"""
@@ -130,7 +130,18 @@ class EnhancedIntentClassifier:
     
     def _train_default(self):
         """Train with enhanced training data."""
-        training_data = [
+        training_data = self._default_training_data()
+        
+        texts = [text for text, _ in training_data]
+        labels = [label for _, label in training_data]
+        
+        self.pipeline.fit(texts, labels)
+        self.save_model()
+        logger.info(f"Trained enhanced classifier with {len(training_data)} examples")
+    
+    def _default_training_data(self) -> List[Tuple[str, str]]:
+        """Get the built-in (text, label) training examples."""
+        return [
             # Commands
             ("open chrome browser", "command"),
             ("launch visual studio code", "command"),
@@ -168,13 +179,6 @@ class EnhancedIntentClassifier:
             ("that's perfect", "conversational"),
             ("goodbye", "conversational"),
         ]
-        
-        texts = [text for text, _ in training_data]
-        labels = [label for _, label in training_data]
-        
-        self.pipeline.fit(texts, labels)
-        self.save_model()
-        logger.info(f"Trained enhanced classifier with {len(training_data)} examples")
     
     async def classify(self, text: str, context: Optional[Dict] = None) -> Intent:
         """
@@ -21,6 +21,7 @@ class SensitiveDataFilter(logging.Filter):
          r'\1=[REDACTED]'),  # Passwords and keys
         (r'\b(?:\d{1,3}\.){3}\d{1,3}\b', '[IP]'),  # IP address
     ]
+    _COMPILED_PATTERNS = [(re.compile(pattern), replacement) for pattern, replacement in PATTERNS]
     
     def filter(self, record: logging.LogRecord) -> bool:
         """
@@ -34,8 +35,8 @@ class SensitiveDataFilter(logging.Filter):
         """
         if hasattr(record, 'msg'):
             msg = str(record.msg)
-            for pattern, replacement in self.PATTERNS:
-                msg = re.sub(pattern, replacement, msg)
+            for pattern, replacement in self._COMPILED_PATTERNS:
+                msg = pattern.sub(replacement, msg)
             record.msg = msg
         
         return True
@@ -1,7 +1,7 @@
 """Core data models for the On-Device Assistant."""
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime
 from enum import Enum
 import json
@@ -309,7 +309,7 @@ class Document:
 class Response:
     """Final assistant response."""
     text: str
-    sources: List[Document]
+    sources: Sequence[Document]
     confidence: float
     suggestions: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
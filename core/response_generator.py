@@ -1,6 +1,6 @@
 """Response generation with personality and templates."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from jinja2 import Template
 
 from core.models import Document, Intent, IntentCategory
@@ -39,7 +39,7 @@ class ResponseGenerator:
         self,
         intent: Intent,
         context: Dict[str, Any],
-        sources: Optional[List[Document]] = None,
+        sources: Optional[Sequence[Document]] = None,
         ai_response: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -67,7 +67,7 @@ class ResponseGenerator:
                 return {
                     'text': context.get('text', 'I processed your request.'),
                     'confidence': 0.5,
-                    'sources': sources or []
+                    'sources': sources or ()
                 }
             
             # Prepare template variables
@@ -91,7 +91,7 @@ class ResponseGenerator:
         return {
             'text': text,
             'confidence': confidence,
-            'sources': sources or [],
+            'sources': sources or (),
             'suggestions': suggestions,
             'metadata': {
                 'intent': intent.category.value,
@@ -121,7 +121,7 @@ class ResponseGenerator:
         self,
         intent: Intent,
         context: Dict[str, Any],
-        sources: Optional[List[Document]]
+        sources: Optional[Sequence[Document]]
     ) -> Dict[str, Any]:
         """Prepare template variables."""
         variables = {
@@ -6,7 +6,7 @@ Automatically integrates knowledge from ALL_APIs_GUIDE.md and data files for enh
 import asyncio
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import re
 
@@ -460,6 +460,16 @@ class SmartKnowledgeIntegrator:
             
             logger.info(f"Added successful interaction to knowledge base")
     
+    async def update_knowledge_batch(self, interactions: List[Tuple[str, str, str]]):
+        """
+        Update knowledge base from a batch of successful interactions
+        
+        Args:
+            interactions: (query, response, feedback) tuples
+        """
+        for query, response, feedback in interactions:
+            await self.update_knowledge_from_interaction(query, response, feedback)
+    
     def _extract_query_pattern(self, query: str) -> str:
         """Extract pattern from query for future matching"""
         # Simple pattern extraction - could be enhanced with NLP
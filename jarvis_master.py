@@ -314,6 +314,9 @@ class JarvisMaster:
         """Gracefully shutdown"""
         logger.info("Shutting down JARVIS MASTER...")
         
+        # Persist feedback still waiting on the batched flush
+        await self.training_system.close()
+        
         if self.web_scraper:
             await self.web_scraper.close()
         
@@ -140,6 +140,8 @@ async def _create_sample_training_data(training_system):
             interaction["response"], 
             interaction["feedback"]
         )
+    
+    await training_system.flush_pending()
 
 
 def create_quick_start_guide():
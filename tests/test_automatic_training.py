@@ -0,0 +1,180 @@
+"""Tests for the automatic training system's interaction log."""
+
+import json
+
+import pytest
+from core import automatic_training
+from core.automatic_training import AutomaticTrainingSystem
+
+
+class FakeClassifier:
+    """Intent classifier stand-in with no base training data."""
+    
+    def _default_training_data(self):
+        return []
+
+
+class FakeIntegrator:
+    """Knowledge integrator stand-in that can be told to fail."""
+    
+    def __init__(self):
+        self.fail = False
+        self.batches = []
+    
+    async def update_knowledge_batch(self, batch):
+        if self.fail:
+            raise RuntimeError("knowledge base unavailable")
+        self.batches.append(batch)
+
+
+class FakeMetrics:
+    """Metrics collector stand-in."""
+    
+    def record_feature_usage(self, *args, **kwargs):
+        pass
+
+
+QUERIES = [
+    "show train status delhi",
+    "weather forecast mumbai today",
+    "show train status delhi",
+    "latest cricket score",
+    "weather forecast mumbai today",
+    "convert dollars into rupees",
+]
+
+
+@pytest.fixture
+def integrator(tmp_path, monkeypatch):
+    """Run in an empty data dir with stubbed collaborators."""
+    monkeypatch.chdir(tmp_path)
+    integrator = FakeIntegrator()
+    monkeypatch.setattr(automatic_training, 'EnhancedIntentClassifier', FakeClassifier)
+    monkeypatch.setattr(automatic_training, 'get_knowledge_integrator', lambda: integrator)
+    monkeypatch.setattr(automatic_training, 'get_metrics_collector', FakeMetrics)
+    return integrator
+
+
+def make_system(**kwargs):
+    """Small windows and segments so eviction and rollover happen quickly."""
+    options = dict(training_threshold=1000, max_pending=1,
+                   max_interactions=3, segment_max_bytes=300)
+    options.update(kwargs)
+    return AutomaticTrainingSystem(**options)
+
+
+def counts(system):
+    """Totals and keyword/group counts across live and tenured interactions."""
+    keywords = {
+        word: len(system._keyword_index.get(word, ())) + system._tenured_kw_counter[word]
+        for word in set(system._keyword_index) | set(system._tenured_kw_counter)
+    }
+    groups = {
+        key: len(system._query_groups.get(key, ())) + system._tenured_group_counter[key]
+        for key in set(system._query_groups) | set(system._tenured_group_counter)
+    }
+    return system._total_interactions(), keywords, groups
+
+
+async def record(system):
+    for query in QUERIES:
+        await system.process_feedback(query, f"answer to {query}", "thanks, great")
+
+
+async def test_reload_after_rollover(integrator):
+    """Test a reload across several segments restores the same counts."""
+    system = make_system(segments_to_load=100)
+    await record(system)
+    before = counts(system)
+    
+    assert before[0] == len(QUERIES)
+    assert len(system._list_segments()) > 1
+    
+    assert counts(make_system(segments_to_load=100)) == before
+
+
+async def test_compaction_keeps_counts(integrator):
+    """Test compacting stale segments folds them into the same counts."""
+    system = make_system(segments_to_load=100)
+    await record(system)
+    before = counts(system)
+    
+    compacted = make_system(segments_to_load=1)
+    assert len(compacted._list_segments()) == 1
+    assert counts(compacted) == before
+    
+    # Compacted totals survive further restarts via the meta file
+    assert counts(make_system(segments_to_load=1)) == before
+
+
+async def test_failed_knowledge_update_still_persists(integrator):
+    """Test the log append does not depend on the knowledge update."""
+    integrator.fail = True
+    system = make_system()
+    await system.process_feedback("show train status", "on time", "thanks, great")
+    await system.close()
+    
+    assert integrator.batches == []
+    assert make_system()._total_interactions() == 1
+
+
+async def test_legacy_migration(integrator, tmp_path):
+    """Test a legacy training_data.json is migrated into the log once."""
+    legacy = {
+        'positive_interactions': [
+            {'query': query, 'response': 'ok', 'feedback': 'thanks'} for query in QUERIES[:2]
+        ],
+        'training_count': 4,
+        'positive_feedback_count': 2,
+    }
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / 'training_data.json').write_text(json.dumps(legacy))
+    
+    system = make_system()
+    assert system._total_interactions() == 2
+    assert system.training_count == 4
+    assert (tmp_path / 'data' / 'training_data.json.migrated').exists()
+    
+    assert make_system()._total_interactions() == 2
+
+
+async def test_corrupt_legacy_file_is_set_aside(integrator, tmp_path):
+    """Test a malformed legacy file doesn't block loading the rest."""
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / 'training_data.json').write_text('{"positive_interactions": [')
+    (data_dir / 'training_meta.json').write_text(json.dumps({'training_count': 7}))
+    (data_dir / 'learned_patterns.json').write_text(
+        json.dumps({'learned_responses': {'show_status_train': ['on time']}})
+    )
+    
+    system = make_system()
+    assert system.training_count == 7
+    assert system.learned_responses == {'show_status_train': ('on time',)}
+    assert (data_dir / 'training_data.json.corrupt').exists()
+    assert not (data_dir / 'training_data.json').exists()
+
+
+async def test_export_omits_cached_fields(integrator):
+    """Test exported interactions carry no underscore-prefixed index fields."""
+    system = make_system()
+    await record(system)
+    
+    with open(await system.export_training_data(), encoding='utf-8') as f:
+        exported = json.load(f)
+    
+    assert [i['query'] for i in exported['positive_interactions']] == QUERIES[-3:]
+    for interaction in exported['positive_interactions']:
+        assert not any(key.startswith('_') for key in interaction)
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("looking for trains", "search"),
+    ("tell me some jokes", "entertainment"),
+    ("important dates", "time_date"),
+    ("this is it?", "question"),
+    ("nothing here", "general"),
+])
+def test_classify_pattern_type(integrator, query, expected):
+    """Test category keywords match at word starts, inflections included."""
+    assert make_system()._classify_pattern_type(query) == expected
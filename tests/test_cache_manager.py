@@ -0,0 +1,99 @@
+"""Tests for the cache manager."""
+
+import pytest
+import asyncio
+from core.cache_manager import CacheManager
+
+
+class TestCacheManager:
+    """Test cache manager functionality."""
+    
+    def test_set_and_get(self):
+        """Test basic set/get with structured keys."""
+        cache = CacheManager(max_size=10)
+        
+        cache.set({'query': 'hello', 'tags': ['a', 'b']}, 'value')
+        
+        assert cache.get({'tags': ['a', 'b'], 'query': 'hello'}) == 'value'
+        assert cache.get('missing', 'default') == 'default'
+    
+    def test_keys_keep_scalar_types_apart(self):
+        """Test keys that are equal across bool/int/float stay distinct."""
+        cache = CacheManager(max_size=10)
+        
+        cache.set({'q': 'btc', 'convert': True}, 'bool')
+        cache.set(('page', True), 'tuple')
+        
+        assert cache.get({'q': 'btc', 'convert': 1}) is None
+        assert cache.get({'q': 'btc', 'convert': 1.0}) is None
+        assert cache.get(('page', 1)) is None
+        assert cache.get({True: 'x'}) is None
+        assert cache.get(('page', True)) == 'tuple'
+        assert cache.get({'convert': True, 'q': 'btc'}) == 'bool'
+    
+    def test_usable_without_event_loop(self):
+        """Test the cache needs no running loop to construct or use."""
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        
+        cache = CacheManager()
+        cache.set('key', 'value')
+        
+        assert cache.get('key') == 'value'
+    
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted at capacity."""
+        cache = CacheManager(max_size=2)
+        
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.exists('a')
+        assert not cache.exists('b')
+        assert cache.get_stats()['evictions'] == 1
+    
+    def test_expired_entries_removed(self):
+        """Test expired entries are dropped on read and cleanup."""
+        cache = CacheManager()
+        
+        cache.set('short', 1, ttl=-1)
+        cache.set('long', 2, ttl=60)
+        cache.cleanup_expired()
+        
+        assert 'short' not in cache.cache
+        assert cache.get('long') == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_caches_none(self):
+        """Test a fetched None is cached instead of refetched."""
+        cache = CacheManager()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            return None
+        
+        assert await cache.get_or_fetch('key', fetch) is None
+        assert await cache.get_or_fetch('key', fetch) is None
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_single_flight(self):
+        """Test concurrent misses for one key share a single fetch."""
+        cache = CacheManager()
+        calls = []
+        
+        async def fetch(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+        
+        results = await asyncio.gather(
+            *[cache.get_or_fetch('key', fetch, None, 21) for _ in range(5)]
+        )
+        
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert not cache._inflight
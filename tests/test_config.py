@@ -0,0 +1,64 @@
+"""Tests for configuration loading."""
+
+import pytest
+from pydantic import ValidationError
+from core import config as config_module
+from core.config import Config, load_config, reload_config
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove ASSISTANT_* variables and reset the module's cached state."""
+    import os
+    
+    for key in list(os.environ):
+        if key.startswith("ASSISTANT_"):
+            monkeypatch.delenv(key)
+    monkeypatch.setattr(config_module, "_assistant_env", None)
+    monkeypatch.setattr(config_module, "_last_load", None)
+    monkeypatch.setattr(config_module, "_config", None)
+
+
+def test_config_is_frozen():
+    """Test config sections reject attribute assignment."""
+    config = Config()
+    
+    with pytest.raises(ValidationError):
+        config.server.port = 1
+    
+    assert hash(config) == hash(Config())
+
+
+def test_defaults_without_file(clean_env, tmp_path):
+    """Test a missing file with no overrides yields the defaults."""
+    config = load_config(str(tmp_path / "missing.yaml"))
+    
+    assert config == Config()
+
+
+def test_env_overrides_use_field_types(clean_env, monkeypatch, tmp_path):
+    """Test env overrides are coerced to the declared field types."""
+    monkeypatch.setenv("ASSISTANT_SERVER__PORT", "9001")
+    monkeypatch.setenv("ASSISTANT_SERVER__API_KEY", "12345")
+    monkeypatch.setenv("ASSISTANT_PRIVACY__DEFAULT_PERMISSIONS__MONITOR_WEB", "yes")
+    
+    config = load_config(str(tmp_path / "missing.yaml"))
+    
+    assert config.server.port == 9001
+    assert config.server.api_key == "12345"
+    assert config.privacy.default_permissions.monitor_web is True
+
+
+def test_reload_picks_up_changes(clean_env, monkeypatch, tmp_path):
+    """Test unchanged inputs reuse the config and changes are reloaded."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("server:\n  port: 8100\n")
+    
+    first = load_config(str(config_file))
+    assert load_config(str(config_file)) is first
+    
+    config_file.write_text("server:\n  port: 8200\n")
+    assert load_config(str(config_file)).server.port == 8200
+    
+    monkeypatch.setenv("ASSISTANT_SERVER__PORT", "8300")
+    assert reload_config(str(config_file)).server.port == 8300
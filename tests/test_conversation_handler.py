@@ -0,0 +1,91 @@
+"""Tests for the conversation handler."""
+
+import pytest
+from core.conversation_handler import ConversationHandler
+
+
+@pytest.fixture
+def handler():
+    """Create conversation handler fixture."""
+    return ConversationHandler()
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("hello there", "greeting"),
+    ("thanks, bye", "farewell"),
+    ("what can you do", "what_can_you_do"),
+    ("open the pod bay doors", None),
+])
+def test_detect_intent(handler, query, expected):
+    """Test intent priority follows pattern declaration order."""
+    intent, confidence = handler.detect_intent(query)
+    
+    assert intent == expected
+    assert (confidence > 0) == (expected is not None)
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("What's the time", "question"),
+    ("Show me trains", "command"),
+    ("it is raining", "statement"),
+    ("this thing", "general"),
+    ("showcase it", "general"),
+    ("", "general"),
+])
+def test_determine_query_type(handler, query, expected):
+    """Test query types are decided on whole words."""
+    assert handler._determine_query_type(query) == expected
+
+
+def test_extract_entities(handler):
+    """Test entity extraction and that cached results are not shared."""
+    entities = handler.extract_entities("Train 12345 from Delhi to Muzaffarnagar for ₹500")
+    
+    assert entities['train_numbers'] == ['12345']
+    assert entities['locations'] == ['Delhi', 'Muzaffarnagar']
+    
+    entities['locations'].append('Nowhere')
+    again = handler.extract_entities("Train 12345 from Delhi to Muzaffarnagar for ₹500")
+    assert again['locations'] == ['Delhi', 'Muzaffarnagar']
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("help", (True, ['technical help', 'information', 'tutorial', 'support'])),
+    ("helpful tips", (False, [])),
+    ("do that", (True, ['Please be more specific about what you need'])),
+])
+def test_detect_ambiguity(handler, query, expected):
+    """Test ambiguity checks match whole words only."""
+    understanding = {'intent': 'search', 'confidence': 0.9}
+    
+    assert handler.detect_ambiguity(query, understanding) == expected
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("2", "Got it! You want: search web. Let me help you with that."),
+    ("yes please", "Great! Let me proceed with that."),
+    ("nope", "I see. Could you please rephrase what you need?"),
+    ("i know", None),
+])
+def test_handle_clarification_response(handler, query, expected):
+    """Test option numbers and whole-word yes/no replies."""
+    handler.awaiting_clarification = True
+    handler.clarification_options = ['verify', 'search web']
+    
+    assert handler.handle_clarification_response(query) == expected
+    assert not handler.awaiting_clarification
+
+
+def test_history_is_bounded(handler):
+    """Test history keeps the most recent exchanges and clears fully."""
+    for i in range(handler.max_history + 5):
+        handler.add_to_history(f"query {i}", f"response {i}", 'greeting')
+    
+    history = handler.get_conversation_history(limit=2)
+    assert [item['query'] for item in history] == ["query 53", "query 54"]
+    assert len(handler.conversation_history) == handler.max_history
+    assert "query 54" in handler.get_conversation_summary()
+    
+    handler.clear_history()
+    assert handler.get_conversation_history() == []
+    assert handler.get_conversation_summary() == "No recent conversation."
@@ -177,5 +177,36 @@ async def test_context_window_limit(engine):
     assert len(engine.context_history) == engine.context_window
 
 
+@pytest.mark.asyncio
+async def test_classify_intent_cache(engine):
+    """Test repeated inputs reuse the cached classification."""
+    calls = []
+    original = engine.input_processor.preprocess
+    engine.input_processor.preprocess = lambda text: calls.append(text) or original(text)
+    
+    first = await engine.classify_intent(UserInput(text="open chrome", source="text"))
+    second = await engine.classify_intent(UserInput(text="open chrome", source="text"))
+    
+    assert calls == ["open chrome"]
+    assert first is not second
+    assert second.category == first.category
+    assert second.context['conversation_length'] == 1
+    
+    second.context['preprocessed']['intent'] = 'mutated'
+    third = await engine.classify_intent(UserInput(text="open chrome", source="text"))
+    assert third.context['preprocessed'] == first.context['preprocessed']
+    
+    engine.clear_context()
+    await engine.classify_intent(UserInput(text="open chrome", source="text"))
+    assert len(calls) == 2
+    
+    # Pattern-path parameters are entity lists; mutating them must not leak
+    text = "hello there, what is 5 + 3 at 12345"
+    pattern = await engine.classify_intent(UserInput(text=text, source="text"))
+    pattern.parameters['numbers'].append(999)
+    again = await engine.classify_intent(UserInput(text=text, source="text"))
+    assert 999 not in again.parameters['numbers']
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,29 @@
+"""Tests for entity extractor."""
+
+import pytest
+from core.entity_extractor import EntityExtractor
+
+
+@pytest.fixture
+def extractor():
+    """Create entity extractor fixture."""
+    return EntityExtractor()
+
+
+def test_extract_custom_entities(extractor):
+    """Test the fused pattern labels each match with its entity type."""
+    text = "Email a@b.com at 10:30 pm about $1,000.50 from C:\\docs\\notes.txt"
+    
+    found = {(entity.type, entity.text) for entity in extractor.extract_custom_entities(text)}
+    
+    assert ('EMAIL', 'a@b.com') in found
+    assert ('TIME', '10:30 pm') in found
+    assert ('MONEY', '$1,000.50') in found
+    assert ('FILE_PATH', 'C:\\docs\\notes.txt') in found
+
+
+def test_extract_action_verbs(extractor):
+    """Test action verbs are located in the original text."""
+    entities = extractor.extract_action_verbs("Please OPEN the file")
+    
+    assert [(entity.text, entity.start) for entity in entities] == [('OPEN', 7)]
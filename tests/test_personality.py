@@ -0,0 +1,56 @@
+"""Tests for the Codeex and Heoster personalities."""
+
+import pytest
+from bisect import bisect_right
+from core.codeex_personality import (
+    _HOUR_TO_PERIOD,
+    CodeexPersonality,
+    EnhancedCodeexPersonality
+)
+from core.heoster_personality import HeosterJarvisPersonality
+
+
+# Greeting period boundaries: morning 5-11, afternoon 12-16, evening 17-20
+PERIOD_BOUNDS = (5, 12, 17, 21)
+PERIODS = ('night', 'morning', 'afternoon', 'evening', 'night')
+
+
+@pytest.mark.parametrize("table", [_HOUR_TO_PERIOD, HeosterJarvisPersonality._HOUR_TO_PERIOD])
+def test_hour_to_period_table(table):
+    """Test the hour lookup tables match the period boundaries."""
+    assert len(table) == 24
+    for hour in range(24):
+        assert table[hour] == PERIODS[bisect_right(PERIOD_BOUNDS, hour)]
+
+
+@pytest.mark.parametrize("personality_cls", [CodeexPersonality, HeosterJarvisPersonality])
+def test_greeting_uses_current_period(personality_cls, monkeypatch):
+    """Test the greeting comes from the pool for the current hour."""
+    import time
+    
+    evening = time.struct_time((2024, 1, 1, 18, 0, 0, 0, 1, -1))
+    monkeypatch.setattr(time, 'localtime', lambda *args: evening)
+    
+    personality = personality_cls()
+    
+    assert personality.get_greeting() in personality.GREETINGS['evening']
+
+
+def test_wrap_response_encourages_every_third_success():
+    """Test encouragement is only added to every third success."""
+    personality = CodeexPersonality()
+    
+    general = personality.wrap_response("Answer")
+    successes = [personality.wrap_response("Done", 'success') for _ in range(3)]
+    
+    assert general.endswith(" Answer")
+    assert all("\n\n" not in text for text in successes[:2])
+    assert successes[2].split("\n\n")[1] in personality.ENCOURAGEMENTS
+
+
+def test_formalize_tone():
+    """Test contractions are expanded in formal tone."""
+    personality = EnhancedCodeexPersonality()
+    
+    assert personality._formalize_tone("Let's go, you're close. It's fine") == \
+        "Let us go, you're close. It is fine"